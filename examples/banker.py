@@ -1,10 +1,10 @@
 from lingo import Lingo, Context, Engine
-import dotenv
+from lingo.utils import load_env
 
 from lingo.cli import loop
 
 
-dotenv.load_dotenv()
+load_env()
 
 
 # Simulate the bank
@@ -2,9 +2,9 @@ from lingo import Lingo, Context, Engine
 from lingo.fsm import StateMachine
 from lingo.cli import loop
 
-import dotenv
+from lingo.utils import load_env
 
-dotenv.load_dotenv()
+load_env()
 
 # 1. Setup
 bot = Lingo("SupportBot")
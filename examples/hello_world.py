@@ -1,10 +1,10 @@
 from lingo import Lingo
 from lingo.cli import loop
 
-import dotenv
+from lingo.utils import load_env
 
 # Load MODEL, BASE_URL, and API_KEY from .env file
-dotenv.load_dotenv()
+load_env()
 
 # Instantiate a raw Lingo instance
 # which comes preconfigured with basic chat functionality
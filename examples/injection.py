@@ -1,10 +1,10 @@
 from lingo import Lingo, Message, LLM, Context, Engine, depends
 from lingo.cli import loop
-import dotenv
+from lingo.utils import load_env
 
 # 1. Setup and Configuration
 # Load environment variables (MODEL, API_KEY, etc.)
-dotenv.load_dotenv()
+load_env()
 
 # Initialize Lingo; it automatically registers itself and its LLM into its registry
 bot = Lingo()
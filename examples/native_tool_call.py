@@ -22,11 +22,11 @@ Run:
 
 import asyncio
 import os
-import dotenv
+from lingo.utils import load_env
 from lingo import LLM, Message, tool
 
 
-dotenv.load_dotenv()
+load_env()
 
 # Allow a convenience override: set OPENROUTER_API_KEY and the example
 # will inject the standard OpenRouter base URL automatically.
@@ -1,9 +1,9 @@
-import dotenv
+from lingo.utils import load_env
 from lingo import Lingo, Context, Engine
 from lingo.cli import loop
 
 # Load environment variables (e.g. OPENAI_API_KEY)
-dotenv.load_dotenv()
+load_env()
 
 # 1. Initialize the Bot
 bot = Lingo(
@@ -1,8 +1,8 @@
-import dotenv
+from lingo.utils import load_env
 from lingo import Lingo, State, Message, depends, Context, Engine
 from lingo.cli import loop
 
-dotenv.load_dotenv()
+load_env()
 
 
 class GameData(State):
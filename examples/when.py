@@ -1,9 +1,9 @@
 from lingo import Lingo, Context, Engine
 from lingo.cli import loop
 from lingo.llm import Message
-from dotenv import load_dotenv
+from lingo.utils import load_env
 
-load_dotenv()
+load_env()
 
 # Initialize the bot
 bot = Lingo(
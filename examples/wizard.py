@@ -25,9 +25,9 @@ from lingo import Lingo, Context, Engine
 from lingo.llm import Message
 from lingo.cli import loop
 
-import dotenv
+from lingo.utils import load_env
 
-dotenv.load_dotenv()
+load_env()
 
 
 class Account(BaseModel):
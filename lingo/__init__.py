@@ -1,17 +1,26 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# `flow` shadows its own submodule, so it is bound eagerly: once `lingo.flow`
+# is imported anywhere, the import system would otherwise overwrite the
+# package attribute with the module object. Importing it already loads the
+# context, engine, llm and tools modules, so their exports come for free.
 from .context import Context
-from .core import Lingo
+from .engine import Engine
 from .flow import Flow, flow
 from .llm import LLM, Message, ToolCall
-from .embed import Embedder
 from .tools import tool
-from .engine import Engine
-from .state import State
 
-from purely import depends
+if TYPE_CHECKING:
+    from purely import depends
+
+    from .core import Lingo
+    from .embed import Embedder
+    from .state import State
 
 __version__ = "2.0.6"
 
-__all__ = [
+__all__ = (
     "Context",
     "depends",
     "Embedder",
@@ -24,4 +33,28 @@ __all__ = [
     "State",
     "tool",
     "ToolCall",
-]
+)
+
+# Heavier exports resolved on first access (PEP 562).
+_LAZY_EXPORTS = {
+    "Lingo": ".core",
+    "Embedder": ".embed",
+    "State": ".state",
+    "depends": "purely",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    # Memoize so later lookups never go through __getattr__ again.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,101 @@
+import math
+from collections import OrderedDict
+from operator import mul
+
+from .embed import Embedder
+from .llm import Message
+
+
+class SemanticCache:
+    """
+    A response cache for `Lingo.chat` that also matches paraphrases.
+
+    The last user message is embedded and compared, by cosine
+    similarity, against the user messages already answered after the
+    exact same conversation prefix. A close enough match replays the
+    stored bot turn instead of running the flow.
+
+    Pass an instance as `Lingo(semantic_cache=...)`; it is consulted
+    after the exact-match cache (`cache=True`) misses.
+
+    A hit replays the recorded messages only: skills, tools and hooks
+    don't run and the state isn't changed (see `Lingo`). The prefix
+    includes the state before the turn, but the paraphrase match makes
+    this a poor fit for bots with side-effecting tools.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        threshold: float = 0.92,
+        capacity: int = 256,
+    ):
+        """
+        Args:
+            embedder: Computes the embeddings. Defaults to `Embedder()`,
+                configured from the environment.
+            threshold: Minimum cosine similarity for a hit.
+            capacity: Maximum number of prefixes kept, and of entries
+                kept per prefix; the oldest ones are dropped first.
+        """
+        self.embedder = embedder or Embedder()
+        self.threshold = threshold
+        self.capacity = capacity
+        self._entries: OrderedDict[bytes, list[tuple[list[float], list[Message]]]] = (
+            OrderedDict()
+        )
+        # store() normally follows a lookup() miss for the same query,
+        # so its embedding is kept around instead of being recomputed.
+        self._last: tuple[str, list[float]] | None = None
+
+    async def _embed(self, query: str) -> list[float]:
+        if self._last is not None and self._last[0] == query:
+            return self._last[1]
+
+        vector = await self.embedder.embed(query)
+        norm = math.sqrt(sum(map(mul, vector, vector))) or 1.0
+        unit = [x / norm for x in vector]
+        self._last = (query, unit)
+        return unit
+
+    async def lookup(self, query: str, prefix: bytes) -> list[Message] | None:
+        """
+        Returns the messages stored for the query most similar to
+        `query` after `prefix`, or None if none is similar enough.
+        """
+        entries = self._entries.get(prefix)
+
+        if not entries:
+            return None
+
+        vector = await self._embed(query)
+        best, best_score = None, self.threshold
+
+        for other, messages in entries:
+            score = sum(map(mul, vector, other))
+
+            if score >= best_score:
+                best, best_score = messages, score
+
+        if best is not None:
+            self._entries.move_to_end(prefix)
+
+        return best
+
+    async def store(self, query: str, prefix: bytes, messages: list[Message]):
+        """Records the messages the bot produced for `query` after `prefix`."""
+        vector = await self._embed(query)
+        entries = self._entries.setdefault(prefix, [])
+        entries.append((vector, messages))
+        self._entries.move_to_end(prefix)
+
+        if len(entries) > self.capacity:
+            del entries[0]
+
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forgets every stored entry."""
+        self._entries.clear()
+        self._last = None
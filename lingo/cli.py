@@ -1,11 +1,134 @@
 import asyncio
+import inspect
+import sys
 
 from pydantic import BaseModel
 
-from .utils import tee
 from .core import Lingo
 
 
+def _fanout(*handlers):
+    """
+    Combines single-argument callbacks into one, built once per run()
+    so each streamed token walks a prebuilt tuple instead of a chain of
+    closures. Missing (None) handlers are dropped.
+
+    Coroutines returned by async handlers are handed back as a single
+    awaitable, which the LLM's `on_*` hooks already await.
+    """
+    handlers = tuple(h for h in handlers if h is not None)
+
+    if not handlers:
+        return None
+
+    if len(handlers) == 1:
+        return handlers[0]
+
+    def fanout(arg):
+        pending = None
+
+        for handler in handlers:
+            resp = handler(arg)
+
+            if inspect.iscoroutine(resp):
+                if pending is None:
+                    pending = []
+
+                pending.append(resp)
+
+        if pending is not None:
+            return _await_all(pending)
+
+    return fanout
+
+
+async def _await_all(coros):
+    for coro in coros:
+        await coro
+
+
+_FLUSH_EVERY = 8
+
+
+def _stdout_writer():
+    """
+    Builds the default `output_fn` for run(): tokens go straight to
+    stdout, which is flushed on newlines and every `_FLUSH_EVERY`
+    tokens instead of once per token.
+    """
+    pending = 0
+
+    def write(token: str):
+        nonlocal pending
+        # Looked up per call so redirected/captured stdout is honored
+        stdout = sys.stdout
+        stdout.write(token)
+        pending += 1
+
+        if pending >= _FLUSH_EVERY or "\n" in token:
+            stdout.flush()
+            pending = 0
+
+    return write
+
+
+_QUEUE_SIZE = 64
+
+
+class _OutputPipe:
+    """
+    Feeds `output_fn` from a consumer task. Producers await `put()`,
+    which blocks while the queue is full (back-pressure). An error
+    raised by `output_fn` is re-raised to the next producer.
+    """
+
+    def __init__(self, output_fn):
+        self._output_fn = output_fn
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(_QUEUE_SIZE)
+        self._error: Exception | None = None
+        self._consumer = asyncio.create_task(self._drain())
+
+    async def _drain(self):
+        queue = self._queue
+
+        while True:
+            token = await queue.get()
+
+            try:
+                if token is None:
+                    return
+
+                # After a failure keep draining, so producers never block
+                if self._error is None:
+                    result = self._output_fn(token)
+
+                    # output_fn may be async (e.g. a websocket sender)
+                    if inspect.iscoroutine(result):
+                        await result
+            except Exception as e:
+                self._error = e
+            finally:
+                queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    async def put(self, token: str):
+        self._raise_error()
+        await self._queue.put(token)
+
+    async def flush(self):
+        """Waits until every queued token has been written."""
+        await self._queue.join()
+        self._raise_error()
+
+    async def close(self):
+        """Writes what is left and stops the consumer."""
+        await self._queue.put(None)
+        await self._consumer
+
+
 async def run(lingo: Lingo, input_fn=None, output_fn=None):
     """
     Runs this model in the terminal, using optional
@@ -17,7 +140,7 @@ async def run(lingo: Lingo, input_fn=None, output_fn=None):
             Defaults to Python's builtin input().
         output_fn: If provided, should be a callback to stream
             the LLM chat response tokens (as strings).
-            Defaults to print().
+            Defaults to writing to stdout.
     """
     print("Name:", lingo.name)
     print("Description:", lingo.description)
@@ -33,45 +156,44 @@ async def run(lingo: Lingo, input_fn=None, output_fn=None):
             return input(">>> ")
 
     if output_fn is None:
-        # Default output_fn just takes a string
-        def output_fn(token):
-            return print(token, end="", flush=True)
+        output_fn = _stdout_writer()
 
-    # The handler is simplified, as it only receives strings
-    cli_token_handler = output_fn
+    # Tokens reach output_fn through a bounded queue, so a slow output
+    # doesn't stall reading the LLM stream.
+    pipe = _OutputPipe(output_fn)
 
     original_on_token = lingo.llm._on_token
     original_on_create = lingo.llm._on_create
 
-    lingo.llm._on_token = (
-        tee(cli_token_handler, original_on_token)
-        if original_on_token
-        else cli_token_handler
-    )
+    lingo.llm._on_token = _fanout(pipe.put, original_on_token)
 
-    def _verbose_on_create(model: BaseModel):
+    async def _verbose_on_create(model: BaseModel):
         """Callback to pretty-print parsed Pydantic models."""
-        output_fn("\n------- [Thinking] -------\n")
-        output_fn(repr(model))
-        output_fn("\n--------------------------\n")
+        await pipe.put("\n------- [Thinking] -------\n")
+        await pipe.put(repr(model))
+        await pipe.put("\n--------------------------\n")
 
     if lingo._verbose:
-        lingo.llm._on_create = (
-            tee(original_on_create, _verbose_on_create)
-            if original_on_create
-            else _verbose_on_create
-        )
+        lingo.llm._on_create = _fanout(original_on_create, _verbose_on_create)
 
     try:
         while True:
-            msg = input_fn()
+            # Off the loop thread, so background tasks keep running while
+            # the user types
+            msg = await asyncio.to_thread(input_fn)
             await lingo.chat(msg)
-            output_fn("\n\n")
+            await pipe.put("\n\n")
+            # Finish writing the reply before prompting again
+            await pipe.flush()
     except EOFError:
         pass
     finally:
-        # Restore the original on_token callback
+        # Restore the original callbacks
         lingo.llm._on_token = original_on_token
+        lingo.llm._on_create = original_on_create
+        await pipe.close()
+        # Make any text buffered by the default writer visible
+        sys.stdout.flush()
 
 
 def loop(lingo: Lingo, input_fn=None, output_fn=None):
@@ -81,4 +203,26 @@ def loop(lingo: Lingo, input_fn=None, output_fn=None):
 
     Receives the same arguments as `run`.
     """
-    asyncio.run(run(lingo, input_fn, output_fn))
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.run(run(lingo, input_fn, output_fn))
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Creates the event loop for `loop()`, using uvloop's libuv-based
+    loop when it is installed (`pip install lingo-ai[uvloop]`) and
+    asyncio's default loop otherwise (e.g., on Windows).
+
+    Tasks are created eagerly: a chat turn whose flow never actually
+    suspends (or the engine's signal waiter when input is already
+    pending) runs to completion without a round trip through the loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        event_loop = asyncio.new_event_loop()
+    else:
+        event_loop = uvloop.new_event_loop()
+
+    event_loop.set_task_factory(asyncio.eager_task_factory)
+    return event_loop
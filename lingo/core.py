@@ -1,19 +1,33 @@
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Callable, Coroutine, Iterator, Protocol, Optional
 from purely import Registry, ensure
 from pydantic import BaseModel, Field, create_model
 
 from .skills import Skill
-from .flow import Flow, flow
+from .flow import Flow, Prepend, flow
 from .llm import LLM, Message
 from .tools import Tool, tool
 from .context import Context
 from .prompts import DEFAULT_SYSTEM_PROMPT
 from .engine import Engine
 from .state import State
+from .cache import SemanticCache
+
+
+_CHAT_CACHE_SIZE = 256
 
 
 class Conversation(Protocol):
+    """
+    The message history kept by Lingo across turns.
+
+    Any append-only sequence works: pass e.g.
+    `collections.deque(maxlen=N)` as `conversation` to keep memory
+    bounded in long-running bots, dropping the oldest messages.
+    """
+
     def append(self, message: Message, /): ...
     def __iter__(self) -> Iterator[Message]: ...
     def __getitem__(self, index: int, /) -> Message: ...
@@ -22,6 +36,26 @@ class Conversation(Protocol):
 
 
 class Lingo:
+    """
+    A chatbot: an LLM, the skills and tools it can use, and the
+    conversation it keeps across `chat()` turns.
+
+    Response caching is opt-in and meant for deterministic, side-effect
+    free bots (FAQ-style answers):
+
+    - `cache=True` replays the bot's previous reply when the exact same
+      conversation (system prompt, state and messages) is seen again.
+    - `semantic_cache=SemanticCache(...)` also replays it when only the
+      last user message differs, if it is close enough in meaning.
+
+    On a cache hit the flow does not run at all: no skills, tools,
+    `before`/`after` hooks or `when` filters are executed, and the state
+    is not changed. The replayed messages are the ones recorded the
+    first time. Both caches key on the state as it was before the turn,
+    but the state changes a turn made are never replayed. Don't enable
+    either for bots whose tools have side effects or read external data.
+    """
+
     def __init__(
         self,
         name: str = "Lingo",
@@ -34,12 +68,17 @@ class Lingo:
         conversation: Conversation | None = None,
         router_prompt: str | None = None,
         state: State | None = None,
+        cache: bool = False,
+        semantic_cache: SemanticCache | None = None,
     ) -> None:
         self.name = name
         self.description = description
         self.system_prompt = system_prompt.format(
             name=self.name, description=self.description
         )
+        # The system prompt never changes, so every rebuilt flow shares
+        # the same prepend node.
+        self._system_node = Prepend(Message.system(self.system_prompt))
         self.llm = llm or LLM()
         self.skills: list[Skill] = skills or []
         self.tools: list[Tool] = tools or []
@@ -59,6 +98,25 @@ class Lingo:
         self._after_hooks: list[Callable] = []
         self._filters: dict[str, Flow] = {}
 
+        # The main flow only depends on the registered skills, hooks and
+        # filters, so it is built once and reused across turns. Every
+        # registration decorator resets it.
+        self._cached_flow: Flow | None = None
+        # The skills the cached flow was built from, to notice direct
+        # edits to the public `skills` list.
+        self._cached_flow_skills: list[Skill] = []
+
+        # Exact-match response cache (opt-in): conversation digest -> the
+        # messages the bot produced for that turn, in LRU order.
+        self._chat_cache: OrderedDict[bytes, list[Message]] | None = (
+            OrderedDict() if cache else None
+        )
+        self._semantic_cache = semantic_cache
+
+        # Engine reused by fresh sessions, see _get_engine()
+        self._engine: Engine | None = None
+        self._engine_loop: asyncio.AbstractEventLoop | None = None
+
         # Session State
         self._runner_task: Optional[asyncio.Task] = None
         self._active_engine: Optional[Engine] = None
@@ -78,6 +136,7 @@ class Lingo:
         skill routing.
         """
         self._before_hooks.append(self.registry.inject(func))
+        self._invalidate()
         return func
 
     def after(self, func: Callable[[Context, Engine], Coroutine]):
@@ -87,6 +146,7 @@ class Lingo:
         Usable to, e.g., compress or clean up the context.
         """
         self._after_hooks.append(self.registry.inject(func))
+        self._invalidate()
         return func
 
     def skill(self, func: Callable[[Context, Engine], Coroutine]):
@@ -94,6 +154,7 @@ class Lingo:
         Decorator to register a method as a skill for the chatbot.
         """
         self.skills.append(s := Skill(self.registry, func))
+        self._invalidate()
         return s
 
     def tool(self, func: Callable):
@@ -101,10 +162,93 @@ class Lingo:
         Decorator to register a function as a tool.
         """
         self.tools.append(t := tool(self.registry.inject(func)))
+        self._invalidate()
         return t
 
+    def _invalidate(self):
+        """
+        Drops everything derived from the registered skills, tools,
+        hooks and filters, after one of them changes.
+        """
+        self._cached_flow = None
+
+        if self._chat_cache is not None:
+            self._chat_cache.clear()
+
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+
+    def _cache_keys(self) -> tuple[bytes, bytes]:
+        """
+        Digests of the system prompt, the current state and the
+        conversation, without and with its last message (the user turn
+        being answered).
+        """
+        h = hashlib.blake2b(self.system_prompt.encode(), digest_size=16)
+
+        if self.state is not None:
+            # Replies can depend on the state, so a turn only matches one
+            # answered from the same state (values without a stable repr,
+            # e.g. plain objects, simply never match).
+            h.update(b"\0state:")
+            h.update(repr(dict(self.state)).encode())
+
+        prefix = h.copy()
+
+        for m in self.messages:
+            prefix = h.copy()
+            h.update(b"\0")
+
+            if isinstance(m.content, str) and not (m.tool_calls or m.tool_call_id):
+                h.update(m.role.encode())
+                h.update(b":")
+                h.update(m.content.encode())
+            else:
+                h.update(
+                    m.model_dump_json(
+                        include={"role", "content", "tool_calls", "tool_call_id"}
+                    ).encode()
+                )
+
+        return prefix.digest(), h.digest()
+
+    def _get_engine(self) -> Engine:
+        """
+        Returns the engine for a new session. Sessions run one at a time
+        and leave its queues empty, so it is reused for as long as the
+        LLM, the tools and the running event loop stay the same.
+        """
+        loop = asyncio.get_running_loop()
+        engine = self._engine
+
+        if (
+            engine is None
+            or engine._llm is not self.llm
+            or engine._tools != self.tools
+            or self._engine_loop is not loop
+        ):
+            engine = self._engine = Engine(self.llm, self.tools)
+            self._engine_loop = loop
+
+        return engine
+
+    def _get_flow(self) -> Flow:
+        """
+        Returns the main flow, building it on first use and again
+        whenever the contents of `skills` change.
+        """
+        if self._cached_flow is not None and self._cached_flow_skills != self.skills:
+            # `skills` was edited directly, bypassing the decorators
+            self._invalidate()
+
+        if self._cached_flow is None:
+            self._cached_flow = self._build_flow()
+            self._cached_flow_skills = list(self.skills)
+
+        return self._cached_flow
+
     def _build_flow(self) -> Flow:
-        flow = Flow("Main flow").prepend(self.system_prompt)
+        flow = Flow("Main flow").then(self._system_node)
 
         for hook in self._before_hooks:
             flow.custom(hook)
@@ -133,16 +277,29 @@ class Lingo:
         # 1. Update Global History
         self.messages.append(Message.user(msg))
 
+        cache_keys: tuple[bytes, bytes] | None = None
+
         # 2. Determine Logic: Resume or Start
         if self._runner_task and not self._runner_task.done():
             # RESUME: Feed input to the waiting engine
             # Note: Engine.input() will handle appending this msg to the local context
             await ensure(self._active_engine).put(msg)
         else:
+            if self._chat_cache is not None or self._semantic_cache is not None:
+                cache_keys = self._cache_keys()
+
+                if (cached := await self._lookup_cached(msg, *cache_keys)) is not None:
+                    # Same (or equivalent) conversation seen before: replay
+                    # the bot's turn
+                    for m in cached:
+                        self.messages.append(m)
+
+                    return self.messages[-1]
+
             # START: Create new session
             context = Context(list(self.messages))
-            engine = Engine(self.llm, self.tools)
-            flow = self._build_flow()
+            engine = self._get_engine()
+            flow = self._get_flow()
 
             # The flow's first node is prepend(system_prompt), which inserts one message
             # at index 0 of the context, shifting all original messages right.
@@ -176,7 +333,9 @@ class Lingo:
 
         # If the flow crashed, re-raise the exception
         if self._runner_task.done() and (exc := self._runner_task.exception()):
-            # Clean up before raising
+            # Clean up before raising; the engine's queues may hold
+            # leftovers from the failed session, so don't reuse it
+            self._engine = None
             self._runner_task = None
             self._active_engine = None
             self._active_context = None
@@ -200,6 +359,15 @@ class Lingo:
 
         # If the task finished cleanly, clear session state
         if self._runner_task.done():
+            # Only turns that ran start to finish without pausing for input
+            # are cacheable; resumed sessions depend on the paused stack.
+            if cache_keys is not None and self._active_context:
+                await self._store_cached(
+                    msg,
+                    *cache_keys,
+                    self._active_context.messages[self._context_sync_offset :],
+                )
+
             self._runner_task = None
             self._active_engine = None
             self._active_context = None
@@ -208,6 +376,32 @@ class Lingo:
 
         return self.messages[-1]
 
+    async def _lookup_cached(
+        self, msg: str, prefix: bytes, key: bytes
+    ) -> list[Message] | None:
+        if self._chat_cache is not None:
+            if (cached := self._chat_cache.get(key)) is not None:
+                self._chat_cache.move_to_end(key)
+                return cached
+
+        if self._semantic_cache is not None:
+            return await self._semantic_cache.lookup(msg, prefix)
+
+        return None
+
+    async def _store_cached(
+        self, msg: str, prefix: bytes, key: bytes, messages: list[Message]
+    ):
+        if (cache := self._chat_cache) is not None:
+            cache[key] = messages
+            cache.move_to_end(key)
+
+            if len(cache) > _CHAT_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        if self._semantic_cache is not None:
+            await self._semantic_cache.store(msg, prefix, messages)
+
     def _build_filters(self):
         condition_keys = list(self._filters.keys())
         fields = {
@@ -235,6 +429,7 @@ class Lingo:
         def decorator(func: Callable[[Context, Engine], Coroutine]) -> Flow:
             f = flow(func)
             self._filters[condition] = f
+            self._invalidate()
             return f
 
         return decorator
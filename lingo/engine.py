@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 from pydantic import BaseModel, create_model
 from typing import Any, Literal, Self
@@ -18,6 +19,25 @@ from .prompts import (
 INPUT_SIGNAL = object()
 
 
+@functools.lru_cache(maxsize=256)
+def _cot_model(name: str, result_cls) -> type[BaseModel]:
+    """
+    Builds (once per name/result type) the Chain-of-Thought model
+    used by choose/decide/equip, so pydantic does not rebuild its
+    core schema and validator on every call.
+    """
+    return create_model(name, reasoning=(str, ...), result=(result_cls, ...))
+
+
+@functools.lru_cache(maxsize=256)
+def _json_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """
+    Returns the (cached) JSON schema of a model class. Schemas are
+    only rendered into prompts, so the shared dict is never mutated.
+    """
+    return model.model_json_schema()
+
+
 class Engine:
     """
     Holds the LLM and tools, and performs all LLM-related
@@ -101,7 +121,7 @@ class Engine:
         prompt_str = DEFAULT_CREATE_PROMPT.format(
             type=model.__name__,
             docs=model.__doc__ or "N/A",
-            schema=model.model_json_schema(),
+            schema=_json_schema(model),
         )
 
         call_messages.append(Message.system(prompt_str))
@@ -111,8 +131,8 @@ class Engine:
 
     # --- Internal helper for CoT models ---
     def _create_cot_model(self, name: str, result_cls) -> type[BaseModel]:
-        """Creates a dynamic Pydantic model for Chain-of-Thought reasoning."""
-        return create_model(name, reasoning=(str, ...), result=(result_cls, ...))
+        """Returns the (cached) Pydantic model for Chain-of-Thought reasoning."""
+        return _cot_model(name, result_cls)
 
     async def choose[T](
         self, context: Context, options: list[T], *instructions: str | Message
@@ -127,7 +147,7 @@ class Engine:
 
         prompt = DEFAULT_CHOOSE_PROMPT.format(
             options="\n".join([f"- {opt}" for opt in mapping.keys()]),
-            format=model_cls.model_json_schema(),
+            format=_json_schema(model_cls),
         )
 
         response = await self.create(
@@ -140,7 +160,7 @@ class Engine:
         Calls the LLM to make a True/False decision.
         """
         model_cls = self._create_cot_model("Decide", bool)
-        prompt = DEFAULT_DECIDE_PROMPT.format(format=model_cls.model_json_schema())
+        prompt = DEFAULT_DECIDE_PROMPT.format(format=_json_schema(model_cls))
 
         response = await self.create(
             context, model_cls, *instructions, Message.system(prompt)
@@ -168,7 +188,7 @@ class Engine:
 
         prompt = DEFAULT_EQUIP_PROMPT.format(
             tools="\n".join([f"- {t.name}: {t.description}" for t in _tools]),
-            format=model_cls.model_json_schema(),
+            format=_json_schema(model_cls),
         )
         response = await self.create(context, model_cls, Message.system(prompt))
         return tool_map[response.result]  # type: ignore
@@ -28,6 +28,8 @@ class Node[T](abc.ABC):
     sequentially, operating on and mutating a shared Context object.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     async def execute(self, context: Context, engine: Engine) -> T:
         """
@@ -43,6 +45,8 @@ class Node[T](abc.ABC):
 class Append(Node[None]):
     """A Leaf node that appends a message to the context."""
 
+    __slots__ = ("msg",)
+
     def __init__(self, msg: Message):
         self.msg = msg
 
@@ -53,6 +57,8 @@ class Append(Node[None]):
 class Prepend(Node[None]):
     """A Leaf node that prepends a message to the context."""
 
+    __slots__ = ("msg",)
+
     def __init__(self, msg: Message):
         self.msg = msg
 
@@ -66,6 +72,8 @@ class Reply(Node[str]):
     that response to the context.
     """
 
+    __slots__ = ("instructions",)
+
     def __init__(self, *instructions: str | Message):
         self.instructions = instructions
 
@@ -81,6 +89,8 @@ class Decide(Node[bool]):
     prompt.
     """
 
+    __slots__ = ("prompt",)
+
     def __init__(self, prompt: str):
         self.prompt = prompt
 
@@ -93,6 +103,8 @@ class Choose[T](Node[T]):
     A leaf node that returns one of several items.
     """
 
+    __slots__ = ("options", "prompt")
+
     def __init__(self, prompt: str, *options: T):
         self.prompt = prompt
         self.options = list(options)
@@ -108,6 +120,8 @@ class Act(Node[Any]):
     to the context as a tool message.
     """
 
+    __slots__ = ("tools",)
+
     def __init__(self, *tools: Tool):
         if not tools:
             raise ValueError("Invoke node must be initialized with at least one Tool.")
@@ -123,6 +137,8 @@ class Act(Node[Any]):
 class NoOp(Node[None]):
     """A Leaf node that does nothing. Used for empty branches."""
 
+    __slots__ = ()
+
     async def execute(self, context: Context, engine: Engine) -> None:
         pass
 
@@ -130,6 +146,8 @@ class NoOp(Node[None]):
 class Create[T: BaseModel](Node[T]):
     """A leaf node to create a custom object."""
 
+    __slots__ = ("instructions", "model")
+
     def __init__(self, model: Type[T], *instructions: Message | str) -> None:
         self.model = model
         self.instructions = instructions
@@ -145,6 +163,8 @@ class FunctionalNode(Node):
     A wrapper Node that executes a user-provided function.
     """
 
+    __slots__ = ("func",)
+
     def __init__(self, func: Callable[[Context, Engine], Coroutine]):
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("Flow function must be a coroutine function")
@@ -165,14 +185,23 @@ class Sequence[T](Node[T]):
     Composite pattern.
     """
 
+    __slots__ = ("nodes",)
+
     def __init__(self, *nodes: Node):
         self.nodes: list[Node] = list(nodes)
 
     async def execute(self, context: Context, engine: Engine) -> T:
         """Executes each child node in order."""
+        nodes = self.nodes
+
+        # Single-node sequences (e.g. a skill's @flow wrapper, or a bare
+        # reply) are common enough to skip the loop for.
+        if len(nodes) == 1:
+            return await nodes[0].execute(context, engine)
+
         result = None
 
-        for node in self.nodes:
+        for node in nodes:
             result = await node.execute(context, engine)
 
         return cast(T, result)
@@ -189,6 +218,8 @@ class When[T](Node[T]):
     child nodes (which are typically Sequence or NoOp nodes).
     """
 
+    __slots__ = ("instructions", "otherwise", "then")
+
     def __init__(self, then: Node[T], otherwise: Node[T], *instructions: str | Message):
         self.then = then
         self.otherwise = otherwise
@@ -207,13 +238,17 @@ class Branch[T](Node[T]):
     child node from a dictionary.
     """
 
+    __slots__ = ("_option_keys", "choices", "instructions")
+
     def __init__(self, *instructions: str | Message, **choices: Node[T]):
         self.choices = choices
         self.instructions = instructions
+        self._option_keys = list(choices)
 
     async def execute(self, context: Context, engine: Engine) -> T:
-        option_keys = list(self.choices.keys())
-        selected_key = await engine.choose(context, option_keys, *self.instructions)
+        selected_key = await engine.choose(
+            context, self._option_keys, *self.instructions
+        )
 
         node_to_run = self.choices.get(selected_key)
 
@@ -229,6 +264,8 @@ class Route[T](Node[T]):
     two or more flows.
     """
 
+    __slots__ = ("_instruction", "flows", "prompt")
+
     def __init__(self, *flows: Flow[T], prompt: str | None = None) -> None:
         if len(flows) < 2:
             raise ValueError("Route needs at least two flows.")
@@ -236,8 +273,9 @@ class Route[T](Node[T]):
         self.flows = list(flows)
         self.prompt = prompt
 
-    async def execute(self, context: Context, engine: Engine) -> T:
-        # Build a description list for the LLM
+        # Build a description list for the LLM once: the flows are fixed,
+        # and an identical routing prompt every turn is friendlier to
+        # provider-side prompt caching.
         # We use the flow's name and description to guide the choice.
         descriptions = []
 
@@ -254,9 +292,12 @@ class Route[T](Node[T]):
         if self.prompt:
             instruction += "\n\n" + self.prompt
 
+        self._instruction = instruction
+
+    async def execute(self, context: Context, engine: Engine) -> T:
         # context.choose uses str(option) for the list of keys.
         # Since Flow.__str__ returns the name, the keys will be clean names.
-        selected_flow = await engine.choose(context, list(self.flows), instruction)
+        selected_flow = await engine.choose(context, self.flows, self._instruction)
 
         # Execute the chosen Flow
         return await selected_flow.execute(context, engine)
@@ -269,6 +310,8 @@ class Repeat[T](Node[T]):
     or the 'max_repeats' limit is reached.
     """
 
+    __slots__ = ("body", "max_repeats", "until")
+
     def __init__(self, body: Node[T], until: Node[bool], max_repeats: int = 5):
         self.body = body
         self.until = until
@@ -297,6 +340,8 @@ class Fork[T](Node[T]):
     Synthesizes results using an aggregator Node or string prompt.
     """
 
+    __slots__ = ("aggregator", "branches")
+
     def __init__(
         self,
         branches: list[Node[Any]],
@@ -338,6 +383,36 @@ class Fork[T](Node[T]):
         return result  # type: ignore
 
 
+class Parallel(Node[list[Any]]):
+    """
+    Executes independent nodes concurrently using context clones.
+    Unlike Fork, nothing is aggregated: the messages each branch
+    appended are merged back into the main context in declaration
+    order, and the branch results are returned as a list.
+    """
+
+    __slots__ = ("branches",)
+
+    def __init__(self, *branches: Node[Any]):
+        self.branches = list(branches)
+
+    async def execute(self, context: Context, engine: Engine) -> list[Any]:
+        base = len(context.messages)
+        clones = [context.clone() for _ in self.branches]
+
+        results = await asyncio.gather(
+            *(node.execute(clone, engine) for node, clone in zip(self.branches, clones))
+        )
+
+        # Merge each branch's new messages as if the branches had run
+        # one after the other.
+        for clone in clones:
+            for message in clone.messages[base:]:
+                context.append(message)
+
+        return list(results)
+
+
 class Retry[T](Node[T]):
     """
     Attempts to execute a node multiple times.
@@ -345,6 +420,8 @@ class Retry[T](Node[T]):
     the context for the next attempt.
     """
 
+    __slots__ = ("body", "fixer", "max_retries")
+
     def __init__(self, body: Node[T], fixer: Node[Any], max_retries: int = 3):
         self.body = body
         self.fixer = fixer
@@ -380,6 +457,8 @@ class Attempt[T](Node[T]):
     and the 'fallback' node is executed instead.
     """
 
+    __slots__ = ("body", "fallback")
+
     def __init__(self, body: Node[T], fallback: Node[T]):
         self.body = body
         self.fallback = fallback
@@ -401,6 +480,8 @@ class Compress(Node[None]):
     - If aggregator is None: Context becomes [Prefix, Last N] (Limit mode).
     """
 
+    __slots__ = ("aggregator", "n", "prefix_k")
+
     def __init__(
         self,
         n: int | None = None,
@@ -453,6 +534,8 @@ class Scope[T](Node[T]):
     its body with the new Engine instance.
     """
 
+    __slots__ = ("body", "tools")
+
     def __init__(self, tools: list[Tool], body: Node[T]):
         self.tools = tools
         self.body = body
@@ -475,6 +558,8 @@ class Flow[T](Sequence[T]):
     composed of other nodes and even nested inside other Flows.
     """
 
+    __slots__ = ("description", "name")
+
     def __init__(
         self,
         name: str | None = None,
@@ -607,6 +692,14 @@ class Flow[T](Sequence[T]):
         """
         return self.then(Fork(list(flows), aggregator))  # type: ignore
 
+    def parallel(self, *nodes: Node[Any]) -> Flow[list[Any]]:
+        """
+        Adds a step that runs independent nodes concurrently.
+        Their new messages are appended in the order the nodes were
+        given, and the step returns the list of their results.
+        """
+        return self.then(Parallel(*nodes))
+
     def retry(self, fixer: Node[Any], max_retries: int = 3) -> Flow[T]:
         """
         Wraps all previously defined steps into a Retry block.
@@ -1,9 +1,11 @@
+import io
 import os
 import json
 import inspect
 import base64
 import mimetypes
-from typing import Any, Callable, Literal, Union
+from functools import cached_property
+from typing import Any, Callable, Literal, Union, get_args
 from pydantic import BaseModel, Field
 import openai
 
@@ -75,6 +77,18 @@ class ToolCall(BaseModel):
     arguments: dict = Field(default_factory=dict)
 
 
+StopReason = Literal[
+    "stop",
+    "length",
+    "tool_calls",
+    "content_filter",
+    "error",
+    "aborted",
+]
+
+_STOP_REASONS = frozenset(get_args(StopReason))
+
+
 class Message(BaseModel):
     """A Pydantic model for a single chat message."""
 
@@ -85,25 +99,25 @@ class Message(BaseModel):
     tool_calls: list[ToolCall] | None = None
     tool_call_id: str | None = None  # required for role="tool" by OpenAI API
     thinking: str | None = None
-    stop_reason: (
-        Literal[
-            "stop",
-            "length",
-            "tool_calls",
-            "content_filter",
-            "error",
-            "aborted",
-        ]
-        | None
-    ) = None
+    stop_reason: StopReason | None = None
     usage: Usage | None = None
 
+    # The factories below skip pydantic validation (model_construct) when
+    # the arguments are already of the right types, which is by far the
+    # common case, and validate as usual otherwise.
+
     @classmethod
     def system(cls, content: str) -> "Message":
+        if isinstance(content, str):
+            return cls.model_construct(role="system", content=content)
+
         return cls(role="system", content=content)
 
     @classmethod
     def user(cls, content: Union[Content, str]) -> "Message":
+        if isinstance(content, str):
+            return cls.model_construct(role="user", content=content)
+
         return cls(role="user", content=content)
 
     @classmethod
@@ -115,6 +129,24 @@ class Message(BaseModel):
         thinking: str | None = None,
         stop_reason: str | None = None,
     ) -> "Message":
+        if (
+            isinstance(content, str)
+            and (usage is None or isinstance(usage, Usage))
+            and (
+                tool_calls is None or all(isinstance(tc, ToolCall) for tc in tool_calls)
+            )
+            and (thinking is None or isinstance(thinking, str))
+            and (stop_reason is None or stop_reason in _STOP_REASONS)
+        ):
+            return cls.model_construct(
+                role="assistant",
+                content=content,
+                usage=usage,
+                tool_calls=tool_calls,
+                thinking=thinking,
+                stop_reason=stop_reason,
+            )
+
         return cls(
             role="assistant",
             content=content,
@@ -201,6 +233,50 @@ class Message(BaseModel):
 
         return dump
 
+    @cached_property
+    def _api_dict(self) -> dict[str, Any]:
+        return self.model_dump()
+
+    def to_api_dict(self) -> dict[str, Any]:
+        """
+        Returns `model_dump()`, computed once per plain-text message.
+
+        The whole history is resent on every LLM call, so this keeps
+        each message from being re-serialized every turn. Only messages
+        whose wire fields can't change in place (string content and no
+        tool calls) are memoized; the rest are dumped on every call. The
+        dict is shared between calls and must not be mutated.
+        """
+        if self.tool_calls is None and isinstance(self.content, str):
+            return self._api_dict
+
+        return self.model_dump()
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        # Reassigning a field changes the wire format
+        self.__dict__.pop("_api_dict", None)
+
+    # The memoized dict lives in __dict__, so it is left out of pickles
+    # and copies (model_copy goes through __copy__/__deepcopy__).
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        state["__dict__"] = {
+            k: v for k, v in state["__dict__"].items() if k != "_api_dict"
+        }
+        return state
+
+    def __copy__(self):
+        copy = super().__copy__()
+        copy.__dict__.pop("_api_dict", None)
+        return copy
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None):
+        copy = super().__deepcopy__(memo)
+        copy.__dict__.pop("_api_dict", None)
+        return copy
+
 
 _SCALAR_JSON = {str: "string", int: "integer", float: "number", bool: "boolean"}
 
@@ -395,13 +471,13 @@ class LLM:
         fire in real time. Tool calls accumulate across multiple chunks; the
         returned Message carries them assembled and parsed.
         """
-        result_chunks: list[str] = []
-        reasoning_chunks: list[str] = []
+        result_buf = io.StringIO()
+        reasoning_buf = io.StringIO()
         usage: Usage | None = None
         last_finish_reason: str | None = None
         tool_call_accumulator: dict[int, dict] = {}
 
-        api_messages = [msg.model_dump() for msg in messages]
+        api_messages = [msg.to_api_dict() for msg in messages]
         call_kwargs = self.extra_kwargs | kwargs
         extra_body = dict(call_kwargs.pop("extra_body", None) or {})
         per_call_reasoning = call_kwargs.pop("reasoning", None)
@@ -416,6 +492,22 @@ class LLM:
         if tools:
             call_kwargs["tools"] = [tool_to_openai_schema(t) for t in tools]
 
+        # Resolve the per-token callbacks once instead of going through
+        # the on_* coroutines for every chunk. Subclasses overriding those
+        # hooks keep getting called.
+        cls = type(self)
+        on_token = self._on_token if cls.on_token is LLM.on_token else self.on_token
+        on_reasoning_token = (
+            self._on_reasoning_token
+            if cls.on_reasoning_token is LLM.on_reasoning_token
+            else self.on_reasoning_token
+        )
+
+        # Loop-invariant lookups, bound once for the whole stream
+        write_result = result_buf.write
+        write_reasoning = reasoning_buf.write
+        iscoroutine = inspect.iscoroutine
+
         async for chunk in await self.client.chat.completions.create(
             model=self.model,  # type: ignore
             messages=api_messages,  # type: ignore
@@ -430,24 +522,32 @@ class LLM:
                     total_tokens=chunk.usage.total_tokens,
                 )
 
-            if not chunk.choices:
+            choices = chunk.choices
+            if not choices:
                 continue
 
-            fr = getattr(chunk.choices[0], "finish_reason", None)
+            choice = choices[0]
+            fr = getattr(choice, "finish_reason", None)
             if fr is not None:
                 last_finish_reason = fr
 
-            delta = chunk.choices[0].delta
+            delta = choice.delta
 
             reasoning = _read_reasoning(delta)
             if reasoning and isinstance(reasoning, str):
-                reasoning_chunks.append(reasoning)
-                await self.on_reasoning_token(reasoning)
+                write_reasoning(reasoning)
+                if on_reasoning_token is not None:
+                    resp = on_reasoning_token(reasoning)
+                    if iscoroutine(resp):
+                        await resp
 
             content = getattr(delta, "content", None)
             if content:
-                await self.on_token(content)
-                result_chunks.append(content)
+                if on_token is not None:
+                    resp = on_token(content)
+                    if iscoroutine(resp):
+                        await resp
+                write_result(content)
 
             tc_chunks = getattr(delta, "tool_calls", None)
             if tc_chunks:
@@ -490,9 +590,10 @@ class LLM:
                 tool_calls.append(tc)
                 await self.on_toolcall_end(tc.id, tc.arguments)
 
-        thinking = "".join(reasoning_chunks) if reasoning_chunks else None
+        # Fragments are only written when non-empty
+        thinking = reasoning_buf.getvalue() or None
         result = Message.assistant(
-            "".join(result_chunks),
+            result_buf.getvalue(),
             usage=usage,
             tool_calls=tool_calls,
             thinking=thinking,
@@ -509,7 +610,7 @@ class LLM:
         using the non-streaming `parse` endpoint. Reasoning kwargs are not forwarded
         because `parse()` rejects unknown fields.
         """
-        api_messages = [msg.model_dump() for msg in messages]
+        api_messages = [msg.to_api_dict() for msg in messages]
 
         response = await self.client.chat.completions.parse(
             model=self.model,  # type: ignore
@@ -1,5 +1,6 @@
 # tests/mocks.py
 
+from collections import deque
 from typing import Any, List, Optional
 from pydantic import BaseModel
 from lingo.llm import LLM, Message, Usage
@@ -10,19 +11,38 @@ class MockLLM(LLM):
     A mock LLM for testing. Allows pre-programming a queue of responses.
     """
 
-    def __init__(self, responses: Optional[List[Any]] = None, **kwargs):
+    def __init__(
+        self,
+        responses: Optional[List[Any]] = None,
+        record_history: bool = True,
+        **kwargs,
+    ):
         super().__init__(model="mock-model", api_key="mock-key", **kwargs)
         self.responses = responses or []
+        # Long-running flows can turn this off so `history` doesn't keep
+        # every message list ever sent alive.
+        self.record_history = record_history
         self.history: List[List[Message]] = []
 
+    @property
+    def responses(self) -> deque[Any]:
+        """The queued responses, consumed from the left."""
+        return self._responses
+
+    @responses.setter
+    def responses(self, responses):
+        # A deque, so taking the next response is O(1) however many are queued
+        self._responses = deque(responses)
+
     async def chat(self, messages: List[Message], **kwargs) -> Message:
         """Simulates a streaming chat response."""
-        self.history.append(messages)
+        if self.record_history:
+            self.history.append(messages)
 
         if not self.responses:
             raise ValueError("MockLLM: No responses left in queue.")
 
-        resp = self.responses.pop(0)
+        resp = self.responses.popleft()
 
         # If the programmed response is already a Message, use it
         if isinstance(resp, Message):
@@ -47,12 +67,13 @@ class MockLLM(LLM):
         self, model: type[T], messages: List[Message], **kwargs
     ) -> T:
         """Simulates a structured 'parse' response."""
-        self.history.append(messages)
+        if self.record_history:
+            self.history.append(messages)
 
         if not self.responses:
             raise ValueError("MockLLM: No responses left in queue.")
 
-        resp = self.responses.pop(0)
+        resp = self.responses.popleft()
 
         # Validate that the mock response matches the expected model type
         if not isinstance(resp, model):
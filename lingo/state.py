@@ -1,9 +1,182 @@
 import yaml
 import contextlib
 import copy
+import functools
+import inspect
+import pickle
 from typing import Any, Type, Self
 from pydantic import BaseModel, ValidationError
 
+# Prefer the libyaml-backed dumper when PyYAML was built with it.
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Schema-backed states with more keys than this are snapshotted via pickle.
+_PICKLE_THRESHOLD = 8
+
+_EMPTY_FROZENSET = frozenset()
+
+# Immutable scalar types that snapshots can share instead of copying.
+_ATOMIC = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Plain containers that class defaults are copied for, per instance.
+_MUTABLE_DEFAULT_TYPES = frozenset({list, dict, set})
+
+# What copying or pickling an uncopyable value (a lock, a socket) raises.
+_COPY_ERRORS = (pickle.PicklingError, TypeError, AttributeError)
+
+# Containers `_fast_clone` walks itself; anything else goes to deepcopy.
+_CONTAINERS = frozenset({dict, list, tuple, set})
+
+_MISSING = object()
+
+# Nesting below this depth is copied by the explicit-stack walk instead
+# of recursing further, so deep values never hit the recursion limit.
+_MAX_RECURSION = 100
+
+
+def _fast_clone(value: Any, memo: dict[int, Any] | None = None) -> Any:
+    """
+    Deep copies JSON-like values (scalars and nested list/dict/tuple/set)
+    without `copy.deepcopy`'s per-type dispatch. Anything else is handed
+    to `copy.deepcopy` with the same `memo`.
+
+    Like deepcopy, an object reached twice is copied once, so aliasing
+    and cycles survive; pass one `memo` to keep that across several
+    values. Nesting depth is not limited by the recursion limit.
+    """
+    if type(value) in _ATOMIC:
+        return value
+
+    return _clone(value, {} if memo is None else memo, 0)
+
+
+def _clone(value: Any, memo: dict[int, Any], depth: int) -> Any:
+    """Recursive part of `_fast_clone`, for non-atomic values."""
+    found = memo.get(id(value), _MISSING)
+
+    if found is not _MISSING:
+        return found
+
+    cls = type(value)
+
+    if cls not in _CONTAINERS:
+        return copy.deepcopy(value, memo)
+
+    if depth >= _MAX_RECURSION:
+        return _clone_deep(value, cls, memo)
+
+    depth += 1
+
+    if cls is dict:
+        result = memo[id(value)] = {}
+
+        for k, v in value.items():
+            result[k] = v if type(v) in _ATOMIC else _clone(v, memo, depth)
+
+        return result
+
+    if cls is list:
+        result = memo[id(value)] = []
+
+        for v in value:
+            result.append(v if type(v) in _ATOMIC else _clone(v, memo, depth))
+
+        return result
+
+    items = [v if type(v) in _ATOMIC else _clone(v, memo, depth) for v in value]
+    # A cycle through this tuple/set may have built a copy of it already
+    found = memo.get(id(value), _MISSING)
+
+    if found is not _MISSING:
+        return found
+
+    result = memo[id(value)] = tuple(items) if cls is tuple else set(items)
+    return result
+
+
+def _clone_deep(value: Any, cls: type, memo: dict[int, Any]) -> Any:
+    """Copies a deeply nested container with an explicit stack."""
+    # Frames are [type, original, target, iterator, pending dict key].
+    # Lists and dicts are memoized up front so cycles resolve to the copy;
+    # tuples and sets are collected into a list and built at the end.
+    stack = [_open_frame(value, cls, memo)]
+
+    while True:
+        frame = stack[-1]
+        kind, _, target, items, _ = frame
+
+        for item in items:
+            if kind is dict:
+                frame[4], item = item
+
+            item_cls = type(item)
+
+            if item_cls in _ATOMIC:
+                item_copy = item
+            else:
+                item_copy = memo.get(id(item), _MISSING)
+
+                if item_copy is _MISSING:
+                    if item_cls in _CONTAINERS:
+                        stack.append(_open_frame(item, item_cls, memo))
+                        break
+
+                    item_copy = copy.deepcopy(item, memo)
+
+            if kind is dict:
+                target[frame[4]] = item_copy
+            else:
+                target.append(item_copy)
+        else:
+            stack.pop()
+            done = _close_frame(frame, memo)
+
+            if not stack:
+                return done
+
+            parent = stack[-1]
+
+            if parent[0] is dict:
+                parent[2][parent[4]] = done
+            else:
+                parent[2].append(done)
+
+
+def _open_frame(value: Any, cls: type, memo: dict[int, Any]) -> list:
+    """Starts copying a container for `_clone_deep`."""
+    if cls is dict:
+        target = memo[id(value)] = {}
+        return [cls, value, target, iter(value.items()), None]
+
+    if cls is list:
+        target = memo[id(value)] = []
+        return [cls, value, target, iter(value), None]
+
+    return [cls, value, [], iter(value), None]
+
+
+def _close_frame(frame: list, memo: dict[int, Any]) -> Any:
+    """Finishes a container copied by `_clone_deep`."""
+    kind, value, target, _, _ = frame
+
+    if kind is dict or kind is list:
+        return target
+
+    # A cycle through this tuple may have built a copy of it already
+    found = memo.get(id(value), _MISSING)
+
+    if found is not _MISSING:
+        return found
+
+    done = memo[id(value)] = tuple(target) if kind is tuple else set(target)
+    return done
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema: Type[BaseModel]):
+    """Returns the schema's compiled validator, looked up once per class."""
+    return schema.__pydantic_validator__.validate_python
+
 
 class State[T: BaseModel](dict):
     """
@@ -15,6 +188,16 @@ class State[T: BaseModel](dict):
     - **Transaction Safety**: Use `atomic()` and `fork()` for rollbacks.
     """
 
+    # Internals live in slots so plain States carry no __dict__.
+    __slots__ = ("_schema", "_shared_keys", "_trust_internal")
+
+    _class_defaults: dict[str, Any] = {}
+    # Keys of `_class_defaults` holding plain list/dict/set values, which
+    # are copied per instance unless shared.
+    _mutable_defaults: tuple[str, ...] = ()
+    # Declared field names, which __setattr__ stores without further checks.
+    _public_names: frozenset[str] = _EMPTY_FROZENSET
+
     def __init_subclass__(cls, **kwargs):
         """
         Intervention to make Pydantic-style defaults work with Dict storage.
@@ -40,33 +223,69 @@ class State[T: BaseModel](dict):
             delattr(cls, k)
 
         # Merge with parent defaults for inheritance support
-        parent_defaults = getattr(cls, "_class_defaults", {})
-        final_defaults = parent_defaults.copy()
+        final_defaults = cls._class_defaults.copy()
         final_defaults.update(defaults)
 
         # Use object.__setattr__ to avoid any interference
         type.__setattr__(cls, "_class_defaults", final_defaults)
+        # Sort out once which defaults need a copy per instance. Anything
+        # else (scalars, but also resources like a connection) is shared.
+        type.__setattr__(
+            cls,
+            "_mutable_defaults",
+            tuple(
+                k
+                for k, v in final_defaults.items()
+                if type(v) in _MUTABLE_DEFAULT_TYPES
+            ),
+        )
+        # Fields declared with or without a default (e.g. `user: str`)
+        annotated = {k for k in inspect.get_annotations(cls) if k[:1] != "_"}
+        type.__setattr__(
+            cls,
+            "_public_names",
+            cls._public_names | frozenset(final_defaults) | annotated,
+        )
 
     def __init__(
         self,
         data: dict | None = None,
         schema: Type[T] | None = None,
-        shared_keys: set[str] | None = None,
+        shared_keys: set[str] | frozenset[str] | None = None,
+        trust_internal: bool = False,
         **kwargs,
     ):
         # 1. Gather all data sources
         # Priority: kwargs > data > subclass_defaults
-        final_data = getattr(self.__class__, "_class_defaults", {}).copy()
-        if data:
-            final_data.update(data)
-        final_data.update(kwargs)
+        # Built in one go; a lone `data` (e.g. from clone()) is used as is,
+        # since dict.__init__ copies it anyway.
+        defaults = self._class_defaults
+        # Frozen so clones can share it (frozenset(frozenset) is a no-op)
+        shared = frozenset(shared_keys) if shared_keys else _EMPTY_FROZENSET
+
+        if defaults or kwargs:
+            final_data = (
+                {**defaults, **data, **kwargs} if data else {**defaults, **kwargs}
+            )
+
+            # Mutable defaults (e.g. `items = []`) get a fresh copy per
+            # instance, unless the key is shared or the value can't be copied
+            for k in self._mutable_defaults:
+                if final_data[k] is defaults[k] and k not in shared:
+                    with contextlib.suppress(*_COPY_ERRORS):
+                        final_data[k] = _fast_clone(defaults[k])
+        else:
+            final_data = data or ()
 
         # 2. Initialize dict
         super().__init__(final_data)
 
         # 3. Setup internals (bypass __setattr__)
         object.__setattr__(self, "_schema", schema)
-        object.__setattr__(self, "_shared_keys", shared_keys or set())
+        object.__setattr__(self, "_shared_keys", shared)
+        # When set, atomic() commits without re-validating: the state was
+        # validated on construction and is only changed by trusted code.
+        object.__setattr__(self, "_trust_internal", trust_internal)
 
         # 4. Validate
         if self._schema:
@@ -76,17 +295,26 @@ class State[T: BaseModel](dict):
         """Validates the current state against the Pydantic schema."""
         if self._schema:
             try:
-                # We validate by constructing the model from the dict content
-                validated = self._schema(**self).model_dump()
-                self.update(validated)
+                # Validate the dict content directly, without kwargs unpacking
+                validated = _get_validator(self._schema)(self).model_dump()
             except ValidationError as e:
                 raise ValueError(f"State validation failed: {e}")
 
+            # Values the validator passed through unchanged (same object)
+            # are not written back; anything filled in, rebuilt or coerced is.
+            missing = object()
+            changed = {
+                k: v for k, v in validated.items() if self.get(k, missing) is not v
+            }
+
+            if changed:
+                self.update(changed)
+
     def __getattr__(self, key: str) -> Any:
         """Enables `state.key` access."""
         # CRITICAL FIX: Immediately fail for private/magic methods.
         # This prevents infinite recursion when pickling/copying checks for __getstate__, etc.
-        if key.startswith("_"):
+        if key[:1] == "_":
             raise AttributeError(key)
 
         try:
@@ -99,8 +327,11 @@ class State[T: BaseModel](dict):
 
     def __setattr__(self, key: str, value: Any):
         """Enables `state.key = value` assignment."""
-        # Private attributes go directly to the instance's __dict__
-        if key.startswith("_"):
+        # Declared fields skip the private-name check
+        if key in self._public_names:
+            self[key] = value
+        # Private attributes go to the instance's slots (or __dict__)
+        elif key[:1] == "_":
             object.__setattr__(self, key, value)
         # Public attributes go to the dictionary content
         else:
@@ -108,7 +339,7 @@ class State[T: BaseModel](dict):
 
     def __delattr__(self, key: str):
         """Enables `del state.key`."""
-        if key.startswith("_"):
+        if key[:1] == "_":
             object.__delattr__(self, key)
         else:
             try:
@@ -119,19 +350,36 @@ class State[T: BaseModel](dict):
     # --- Copying & Serialization Logic ---
 
     def _smart_copy(self) -> dict:
-        """Deep copies data, preserving shared keys by reference."""
-        new_data = {}
-        for k, v in self.items():
-            if k in self._shared_keys:
-                new_data[k] = v
-            else:
-                new_data[k] = copy.deepcopy(v)
-        return new_data
+        """
+        Deep copies data, preserving shared keys by reference. Objects
+        referenced from several keys stay shared within the copy.
+        """
+        shared = self._shared_keys
+
+        if not shared:
+            if self._schema is not None and len(self) > _PICKLE_THRESHOLD:
+                # Validated data is mostly plain builtins, which pickle
+                # round-trips faster than a Python-level walk
+                try:
+                    return pickle.loads(pickle.dumps(dict(self), protocol=5))
+                except _COPY_ERRORS:
+                    pass
+
+            # Common case: no per-key membership test needed
+            memo = {}
+            return {k: _fast_clone(v, memo) for k, v in dict.items(self)}
+
+        # Shared values map to themselves, wherever they are referenced
+        memo = {id(self[k]): self[k] for k in shared if k in self}
+        return {k: v if k in shared else _fast_clone(v, memo) for k, v in self.items()}
 
     def clone(self) -> Self:
         """Returns an independent copy of the State (for parallel branches)."""
         new_state = self.__class__(
-            self._smart_copy(), schema=self._schema, shared_keys=self._shared_keys
+            self._smart_copy(),
+            schema=self._schema,
+            shared_keys=self._shared_keys,
+            trust_internal=self._trust_internal,
         )
         return new_state
 
@@ -141,12 +389,33 @@ class State[T: BaseModel](dict):
 
     def __deepcopy__(self, memo):
         """Support for copy.deepcopy()"""
-        # We manually implement this to use our smart copy logic
-        # and avoid recursive pickling checks.
-        return self.clone()
+        # Registered in `memo` before copying the values, so a state
+        # referenced twice (or by its own values) is copied only once.
+        cls = self.__class__
+        new_state = cls.__new__(cls)
+        memo[id(self)] = new_state
+
+        object.__setattr__(new_state, "_schema", self._schema)
+        object.__setattr__(new_state, "_shared_keys", self._shared_keys)
+        object.__setattr__(new_state, "_trust_internal", self._trust_internal)
+
+        shared = self._shared_keys
+        dict.update(
+            new_state,
+            {
+                k: v if k in shared else copy.deepcopy(v, memo)
+                for k, v in dict.items(self)
+            },
+        )
+        return new_state
 
     # --- Context Managers ---
 
+    def _restore(self, snapshot: dict):
+        """Replaces the whole content with a `_smart_copy()` snapshot."""
+        dict.clear(self)
+        dict.update(self, snapshot)
+
     @contextlib.contextmanager
     def atomic(self):
         """
@@ -155,11 +424,10 @@ class State[T: BaseModel](dict):
         snapshot = self._smart_copy()
         try:
             yield self
-            if self._schema:
+            if self._schema and not self._trust_internal:
                 self.validate()
         except Exception:
-            self.clear()
-            self.update(snapshot)
+            self._restore(snapshot)
             raise
 
     @contextlib.contextmanager
@@ -171,8 +439,7 @@ class State[T: BaseModel](dict):
         try:
             yield self
         finally:
-            self.clear()
-            self.update(snapshot)
+            self._restore(snapshot)
 
     def render(self, *keys: str) -> str:
         """
@@ -195,4 +462,6 @@ class State[T: BaseModel](dict):
         # 2. Render
         # default_flow_style=False -> Uses block style (lists/dicts are expanded)
         # sort_keys=False -> Preserves insertion order (better for context logic)
-        return yaml.safe_dump(data, default_flow_style=False, sort_keys=False).strip()
+        return yaml.dump(
+            data, Dumper=_Dumper, default_flow_style=False, sort_keys=False
+        ).strip()
@@ -2,6 +2,7 @@ import abc
 import asyncio
 import inspect
 import re
+from functools import cached_property
 from purely.di import _Depends
 from pydantic import BaseModel
 from typing import Callable, Any, get_type_hints
@@ -91,20 +92,31 @@ class DelegateTool(Tool):
         super().__init__(name, description)
         self._target = target
 
+    # The target never changes, so its signature and type hints are
+    # introspected once, on first use (hints may be forward references
+    # that only resolve after decoration), instead of on every schema
+    # build or parameter inference.
+    @cached_property
+    def _signature(self) -> inspect.Signature:
+        return inspect.signature(self._target)
+
+    @cached_property
+    def _hints(self) -> dict[str, Any]:
+        try:
+            return get_type_hints(self._target)
+        except (AttributeError, TypeError, NameError):
+            # Fallback if type hints are complex or unavailable
+            return getattr(self._target, "__annotations__", {})
+
     def parameters(self) -> dict[str, type]:
         """
         Extracts parameters from the function's type annotations,
         filtering out internal (_) and dependency-injected parameters.
         """
-        sig = inspect.signature(self._target)
-        try:
-            hints = get_type_hints(self._target)
-        except (AttributeError, TypeError, NameError):
-            # Fallback if type hints are complex or unavailable
-            hints = getattr(self._target, "__annotations__", {})
+        hints = self._hints
 
         params = {}
-        for name, param in sig.parameters.items():
+        for name, param in self._signature.parameters.items():
             # Exclude internal/manual parameters (starting with _)
             if name.startswith("_"):
                 continue
@@ -124,9 +136,8 @@ class DelegateTool(Tool):
 
     def defaults(self) -> dict[str, Any]:
         """Params that carry a signature default (excluding _/DI params)."""
-        sig = inspect.signature(self._target)
         out: dict[str, Any] = {}
-        for name, param in sig.parameters.items():
+        for name, param in self._signature.parameters.items():
             if name.startswith("_"):
                 continue
             if isinstance(param.default, _Depends):
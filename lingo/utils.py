@@ -1,3 +1,6 @@
+import os
+import sys
+from pathlib import Path
 from pydantic import BaseModel
 from typing import get_type_hints, Union, Any, Callable
 
@@ -93,6 +96,113 @@ def generate_pydantic_code(model_cls: type[BaseModel]) -> str:
     return "\n".join(lines)
 
 
+# Resolved path -> ((mtime, size), values this module set) of the last
+# .env file loaded.
+_loaded_env_files: dict[Path, tuple[tuple[float, int], dict[str, str]]] = {}
+
+
+def _find_env_file(name: str, stacklevel: int) -> Path | None:
+    """
+    Looks for `name` in the directory of the file `stacklevel` frames up
+    from `load_env` and then in each of its parents, like
+    `dotenv.find_dotenv()`. Falls back to the current directory when
+    there is no calling file (e.g. a REPL).
+    """
+    # +1 for this function's own frame
+    frame = sys._getframe(stacklevel + 1)
+    caller = frame.f_globals.get("__file__")
+    start = Path(caller).resolve().parent if caller else Path.cwd()
+
+    for folder in (start, *start.parents):
+        candidate = folder / name
+
+        if candidate.is_file():
+            return candidate
+
+    return None
+
+
+def load_env(path: str | os.PathLike | None = None, stacklevel: int = 1) -> bool:
+    """
+    Loads `KEY=VALUE` pairs from a .env file into `os.environ`,
+    never overriding variables that were set elsewhere.
+
+    Without `path`, the nearest `.env` is used, searching upward from
+    the calling file's directory (like `dotenv.load_dotenv()`). As with
+    `warnings.warn`, `stacklevel` picks which caller that is: a helper
+    that wraps `load_env` passes 2 to search from its own caller.
+
+    The file is parsed at most once per (path, mtime, size), so calling
+    this at import time from many modules is free. When the file changes,
+    the variables it set earlier are updated with the new values. Set
+    `LINGO_SKIP_DOTENV=1` to disable loading altogether.
+
+    Returns True if the file was (re)loaded.
+    """
+    if os.environ.get("LINGO_SKIP_DOTENV") == "1":
+        return False
+
+    if path is None:
+        found = _find_env_file(".env", stacklevel)
+
+        if found is None:
+            return False
+
+        path = found
+
+    file = Path(path).resolve()
+
+    try:
+        stat = file.stat()
+    except OSError:
+        return False
+
+    key = (stat.st_mtime, stat.st_size)
+    previous_key, previous = _loaded_env_files.get(file, (None, {}))
+
+    if previous_key == key:
+        return False
+
+    applied: dict[str, str] = {}
+
+    for line in file.read_text().splitlines():
+        line = line.strip()
+
+        if not line or line.startswith("#"):
+            continue
+
+        if line.startswith("export "):
+            line = line[len("export ") :]
+
+        name, sep, value = line.partition("=")
+
+        if not sep:
+            continue
+
+        name = name.strip()
+        value = value.strip()
+
+        quote = value[:1]
+        end = value.find(quote, 1) if quote in ("'", '"') else -1
+
+        if end != -1:
+            # Quoted: take what's inside, ignoring anything after it
+            value = value[1:end]
+        elif " #" in value:
+            # Trailing comment on an unquoted value
+            value = value.split(" #", 1)[0].rstrip()
+
+        current = os.environ.get(name)
+
+        # Set it if it's new, or if it still holds what this file set last time
+        if current is None or (name in previous and current == previous[name]):
+            os.environ[name] = value
+            applied[name] = value
+
+    _loaded_env_files[file] = (key, applied)
+    return True
+
+
 def tee(*functions):
     """
     Calls all functions with the same argunents.
@@ -0,0 +1,94 @@
+# tests/test_cache.py
+"""
+Tests for lingo/cache.py — the SemanticCache used by Lingo.chat.
+"""
+
+import pytest
+from lingo import Lingo, Message
+from lingo.cache import SemanticCache
+from lingo.mock import MockLLM
+
+
+class FakeEmbedder:
+    """Maps known sentences to fixed vectors and counts the calls."""
+
+    VECTORS = {
+        "Tell me about Philadelphia": [1.0, 0.0, 0.0],
+        "Talk to me about the city of Philadelphia": [0.98, 0.1, 0.0],
+        "What's the weather like?": [0.0, 0.0, 1.0],
+    }
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def embed(self, text: str) -> list[float]:
+        self.calls.append(text)
+        return self.VECTORS[text]
+
+
+@pytest.fixture
+def cache() -> SemanticCache:
+    return SemanticCache(FakeEmbedder())
+
+
+@pytest.mark.asyncio
+async def test_lookup_matches_paraphrase(cache):
+    reply = [Message.assistant("A city in Pennsylvania.")]
+    await cache.store("Tell me about Philadelphia", b"prefix", reply)
+
+    hit = await cache.lookup("Talk to me about the city of Philadelphia", b"prefix")
+
+    assert hit is reply
+
+
+@pytest.mark.asyncio
+async def test_lookup_misses_unrelated_query(cache):
+    await cache.store(
+        "Tell me about Philadelphia", b"prefix", [Message.assistant("A city.")]
+    )
+
+    assert await cache.lookup("What's the weather like?", b"prefix") is None
+
+
+@pytest.mark.asyncio
+async def test_lookup_is_scoped_to_prefix(cache):
+    await cache.store(
+        "Tell me about Philadelphia", b"prefix", [Message.assistant("A city.")]
+    )
+
+    assert await cache.lookup("Tell me about Philadelphia", b"other") is None
+
+
+@pytest.mark.asyncio
+async def test_store_reuses_lookup_embedding(cache):
+    await cache.store("What's the weather like?", b"prefix", [])
+    cache.embedder.calls.clear()
+
+    query = "Tell me about Philadelphia"
+    assert await cache.lookup(query, b"prefix") is None
+    await cache.store(query, b"prefix", [Message.assistant("A city.")])
+
+    assert cache.embedder.calls == [query]
+
+
+@pytest.mark.asyncio
+async def test_capacity_drops_oldest_entries():
+    cache = SemanticCache(FakeEmbedder(), capacity=1)
+
+    await cache.store("Tell me about Philadelphia", b"prefix", [])
+    await cache.store("What's the weather like?", b"prefix", [])
+
+    assert await cache.lookup("Tell me about Philadelphia", b"prefix") is None
+
+
+@pytest.mark.asyncio
+async def test_lingo_serves_paraphrase_from_semantic_cache():
+    llm = MockLLM(["A city in Pennsylvania."])
+    app = Lingo(llm=llm, semantic_cache=SemanticCache(FakeEmbedder()))
+
+    first = await app.chat("Tell me about Philadelphia")
+    app.messages.clear()
+    second = await app.chat("Talk to me about the city of Philadelphia")
+
+    assert second is first
+    assert len(llm.history) == 1
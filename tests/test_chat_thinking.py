@@ -60,3 +60,43 @@ async def test_thinking_none_when_no_reasoning():
 
     msg = await llm.chat([])
     assert msg.thinking is None
+
+
+def _chunk_with_content(content):
+    chunk = _chunk_with_reasoning(None)
+    chunk.choices[0].delta.content = content
+    return chunk
+
+
+@pytest.mark.asyncio
+async def test_token_callbacks_sync_async_and_overridden():
+    """on_token callbacks fire per chunk, sync or async, and subclass
+    overrides of the on_* hooks are still honored."""
+
+    def make_stream():
+        async def gen():
+            yield _chunk_with_reasoning("hmm")
+            yield _chunk_with_content("Hello ")
+            yield _chunk_with_content("world")
+
+        return gen()
+
+    seen: list[str] = []
+
+    async def async_cb(token):
+        seen.append(token)
+
+    llm = LLM(model="x", api_key="k", on_token=seen.append, on_reasoning_token=async_cb)
+    llm.client.chat.completions.create = AsyncMock(return_value=make_stream())
+    await llm.chat([])
+    assert seen == ["hmm", "Hello ", "world"]
+
+    class LoudLLM(LLM):
+        async def on_token(self, token):
+            seen.append(token.upper())
+
+    seen.clear()
+    loud = LoudLLM(model="x", api_key="k")
+    loud.client.chat.completions.create = AsyncMock(return_value=make_stream())
+    await loud.chat([])
+    assert seen == ["HELLO ", "WORLD"]
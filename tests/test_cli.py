@@ -10,6 +10,7 @@ Focus areas:
 """
 
 import asyncio
+import threading
 import pytest
 from lingo import Lingo
 from lingo.mock import MockLLM
@@ -72,6 +73,20 @@ class TestRunBasic:
         assert "Two" in full_output
         assert "Three" in full_output
 
+    @pytest.mark.asyncio
+    async def test_run_awaits_async_output_fn(self):
+        """An async output_fn (e.g. a websocket sender) gets every token."""
+        app = make_cli_app(responses=["One Two Three"])
+        tokens: list[str] = []
+
+        async def send(token: str):
+            await asyncio.sleep(0)
+            tokens.append(token)
+
+        await run(app, input_fn=OneShotInputFn("Go"), output_fn=send)
+
+        assert "".join(tokens) == "One Two Three \n\n"
+
     @pytest.mark.asyncio
     async def test_run_prints_header(self, capsys):
         """run() always prints name/description header to stdout."""
@@ -85,7 +100,7 @@ class TestRunBasic:
     @pytest.mark.asyncio
     async def test_run_restores_on_token_after_completion(self):
         """run() must restore the original _on_token callback after finishing."""
-        # Must be callable — tee() will invoke it during token streaming
+        # Must be callable — run() will invoke it during token streaming
         original_tokens: list[str] = []
         sentinel = original_tokens.append  # a callable original handler
 
@@ -117,6 +132,95 @@ class TestRunBasic:
 
         assert app.llm._on_token is sentinel
 
+    @pytest.mark.asyncio
+    async def test_run_restores_on_create_in_verbose_mode(self):
+        """run() must also restore _on_create, which verbose mode replaces."""
+        sentinel = []
+        llm = MockLLM(["Response"])
+        llm._on_create = sentinel.append
+
+        app = Lingo(llm=llm, verbose=True)
+        await run(app, input_fn=OneShotInputFn("test"), output_fn=lambda t: None)
+
+        assert app.llm._on_create == sentinel.append
+
+    @pytest.mark.asyncio
+    async def test_run_awaits_async_original_on_token(self):
+        """An async _on_token installed before run() still sees every token."""
+        seen: list[str] = []
+
+        async def original(token):
+            seen.append(token)
+
+        llm = MockLLM(["One Two"])
+        llm._on_token = original
+
+        app = Lingo(llm=llm)
+        tokens: list[str] = []
+        await run(app, input_fn=OneShotInputFn("Go"), output_fn=tokens.append)
+
+        assert "".join(seen).split() == ["One", "Two"]
+        assert "".join(tokens).split() == ["One", "Two"]
+
+    @pytest.mark.asyncio
+    async def test_run_reads_input_off_the_event_loop(self):
+        """Background tasks keep running while input_fn blocks."""
+        app = make_cli_app(responses=[])
+        ticked = threading.Event()
+        observed: list[bool] = []
+
+        async def background():
+            ticked.set()
+
+        def blocking_input():
+            observed.append(ticked.wait(timeout=2))
+            raise EOFError
+
+        task = asyncio.create_task(background())
+        await run(app, input_fn=blocking_input, output_fn=lambda t: None)
+        await task
+
+        assert observed == [True]
+
+    @pytest.mark.asyncio
+    async def test_run_surfaces_output_fn_errors(self):
+        """An exception raised by output_fn propagates out of run()."""
+        app = make_cli_app(responses=["Hello there"])
+
+        def broken_output(token):
+            raise RuntimeError("terminal closed")
+
+        with pytest.raises(RuntimeError, match="terminal closed"):
+            await run(app, input_fn=OneShotInputFn("Hi"), output_fn=broken_output)
+
+    @pytest.mark.asyncio
+    async def test_run_writes_reply_before_next_prompt(self):
+        """The whole reply is written before input_fn is called again."""
+        app = make_cli_app(responses=["One Two", "Three"])
+        events: list[str] = []
+        prompts = ["Hi", "Again"]
+
+        def input_fn():
+            events.append("prompt")
+
+            if not prompts:
+                raise EOFError
+
+            return prompts.pop(0)
+
+        await run(app, input_fn=input_fn, output_fn=events.append)
+
+        assert events == [
+            "prompt",
+            "One ",
+            "Two ",
+            "\n\n",
+            "prompt",
+            "Three ",
+            "\n\n",
+            "prompt",
+        ]
+
     @pytest.mark.asyncio
     async def test_run_eofError_exits_cleanly(self):
         """EOFError from input_fn should cause run() to return without raising."""
@@ -179,7 +283,7 @@ class TestRunVerbose:
 class TestRunDefaultCallbacks:
     @pytest.mark.asyncio
     async def test_run_with_default_output_fn_prints(self, monkeypatch, capsys):
-        """When output_fn is None, run() defaults to print() — tokens appear on stdout."""
+        """When output_fn is None, run() writes tokens to stdout."""
         app = make_cli_app(responses=["PrintedToken"])
 
         call_count = 0
@@ -198,6 +302,37 @@ class TestRunDefaultCallbacks:
         # The token "PrintedToken" should have been printed (plus the "\n\n" separator)
         assert "PrintedToken" in captured.out
 
+    def test_default_output_fn_flushes_in_batches(self, monkeypatch):
+        """The default writer flushes on newlines and every few tokens."""
+        from lingo.cli import _FLUSH_EVERY, _stdout_writer
+
+        class FakeStdout:
+            def __init__(self):
+                self.written: list[str] = []
+                self.flushes = 0
+
+            def write(self, text):
+                self.written.append(text)
+
+            def flush(self):
+                self.flushes += 1
+
+        fake = FakeStdout()
+        monkeypatch.setattr("sys.stdout", fake)
+        write = _stdout_writer()
+
+        for _ in range(_FLUSH_EVERY - 1):
+            write("tok ")
+
+        assert fake.flushes == 0
+
+        write("tok ")
+        assert fake.flushes == 1
+
+        write("end\n")
+        assert fake.flushes == 2
+        assert "".join(fake.written).endswith("end\n")
+
     @pytest.mark.asyncio
     async def test_run_with_default_input_fn(self, monkeypatch, capsys):
         """When input_fn is None, run() defaults to input() — one prompt fires."""
@@ -254,3 +389,45 @@ class TestLoop:
 
         # Should not raise
         loop(app, input_fn=immediate_eof, output_fn=lambda t: None)
+
+    def test_loop_uses_uvloop_when_installed(self, monkeypatch):
+        """loop() builds its event loop through uvloop when it is importable."""
+        import sys
+        import types
+
+        created = []
+
+        def new_event_loop():
+            created.append(asyncio.new_event_loop())
+            return created[-1]
+
+        fake = types.ModuleType("uvloop")
+        fake.new_event_loop = new_event_loop
+        monkeypatch.setitem(sys.modules, "uvloop", fake)
+
+        app = make_cli_app(responses=["Hi"])
+        loop(app, input_fn=OneShotInputFn("Hello"), output_fn=lambda t: None)
+
+        assert len(created) == 1
+
+    def test_loop_falls_back_without_uvloop(self, monkeypatch):
+        """Without uvloop, loop() still runs on asyncio's default loop."""
+        import sys
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        app = make_cli_app(responses=["Hi"])
+        tokens: list[str] = []
+        loop(app, input_fn=OneShotInputFn("Hello"), output_fn=tokens.append)
+
+        assert "Hi" in "".join(tokens)
+
+    def test_loop_uses_eager_task_factory(self):
+        """The loop created by loop() runs tasks eagerly."""
+        from lingo.cli import _new_event_loop
+
+        event_loop = _new_event_loop()
+        try:
+            assert event_loop.get_task_factory() is asyncio.eager_task_factory
+        finally:
+            event_loop.close()
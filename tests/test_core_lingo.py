@@ -16,6 +16,7 @@ import pytest
 from pydantic import BaseModel
 from lingo import Lingo, Message, Engine, Context, Flow
 from lingo.mock import MockLLM
+from lingo.state import State
 from lingo.skills import Skill
 from lingo.prompts import DEFAULT_SYSTEM_PROMPT
 
@@ -258,6 +259,16 @@ class TestBuildFlow:
         node_types = [type(n).__name__ for n in built.nodes]
         assert "Prepend" in node_types
 
+    def test_system_prompt_node_is_shared_across_builds(self):
+        """Rebuilt flows reuse the same system prompt node."""
+        app = make_app()
+
+        first = app._build_flow()
+        second = app._build_flow()
+
+        assert first.nodes[0] is second.nodes[0] is app._system_node
+        assert app._system_node.msg.content == app.system_prompt
+
     def test_one_skill_uses_skill_flow(self):
         """Single skill: flow ends with the skill's built flow, no Route."""
         from lingo.flow import Route
@@ -347,6 +358,82 @@ class TestBuildFlow:
         built = app._build_flow()
         assert isinstance(built, Flow)
 
+    @pytest.mark.asyncio
+    async def test_flow_reused_across_turns(self):
+        app = make_app(responses=["First reply", "Second reply"])
+
+        await app.chat("First message")
+        first = app._cached_flow
+        await app.chat("Second message")
+
+        assert first is not None
+        assert app._cached_flow is first
+
+    @pytest.mark.asyncio
+    async def test_engine_reused_across_turns(self):
+        app = make_app(responses=["First reply", "Second reply"])
+
+        await app.chat("First message")
+        first = app._engine
+        await app.chat("Second message")
+
+        assert first is not None
+        assert app._engine is first
+
+    @pytest.mark.asyncio
+    async def test_engine_rebuilt_when_llm_or_tools_change(self):
+        app = make_app(responses=["First reply"])
+        await app.chat("First message")
+        first = app._engine
+
+        app.llm = MockLLM(["Second reply"])
+        await app.chat("Second message")
+        second = app._engine
+        assert second is not first
+        assert second._llm is app.llm
+
+        @app.tool
+        def ping() -> str:
+            """Ping."""
+            return "pong"
+
+        app.llm.responses.append("Third reply")
+        await app.chat("Third message")
+        assert app._engine is not second
+        assert app._engine._tools == app.tools
+
+    def test_registration_invalidates_cached_flow(self):
+        app = make_app()
+        before = app._get_flow()
+
+        @app.skill
+        async def my_skill(ctx, eng):
+            """A skill."""
+            pass
+
+        after = app._get_flow()
+        assert after is not before
+        assert app._get_flow() is after
+
+    @pytest.mark.asyncio
+    async def test_direct_skills_edit_rebuilds_flow(self):
+        app = make_app(responses=["Plain reply"])
+        await app.chat("Hi")
+        before = app._get_flow()
+
+        async def greet(ctx, eng):
+            """Greets the user."""
+            ctx.append(await eng.reply(ctx, "From skill"))
+
+        app.skills.append(Skill(app.registry, greet))
+        app.llm.responses.append("Skill reply")
+
+        response = await app.chat("Hello")
+
+        assert app._get_flow() is not before
+        assert response.content == "Skill reply"
+        assert app.llm.history[-1][-1].content == "From skill"
+
 
 # ---------------------------------------------------------------------------
 # chat() end-to-end tests (using MockLLM)
@@ -394,6 +481,20 @@ class TestChatEndToEnd:
 
         assert count_after_second > count_after_first
 
+    @pytest.mark.asyncio
+    async def test_bounded_deque_conversation(self):
+        """A deque(maxlen=N) conversation keeps only the newest messages."""
+        from collections import deque
+
+        app = make_app(responses=["One", "Two", "Three"], conversation=deque(maxlen=4))
+
+        for msg in ["a", "b", "c"]:
+            result = await app.chat(msg)
+
+        assert len(app.messages) == 4
+        assert result.content == "Three"
+        assert [m.content for m in app.messages] == ["b", "Two", "c", "Three"]
+
     @pytest.mark.asyncio
     async def test_runner_task_cleared_after_completion(self):
         """After a successful chat(), the session state is cleaned up."""
@@ -501,6 +602,93 @@ class TestChatResume:
         assert "assistant" in roles
 
 
+# ---------------------------------------------------------------------------
+# chat() response cache
+# ---------------------------------------------------------------------------
+
+
+class TestChatCache:
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self):
+        app = make_app(responses=["First", "Second"])
+
+        await app.chat("Hi")
+        app.messages.clear()
+        response = await app.chat("Hi")
+
+        assert response.content == "Second"
+        assert len(app.llm.history) == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_conversation_is_served_from_cache(self):
+        app = make_app(responses=["Hello!"], cache=True)
+
+        first = await app.chat("Hi")
+        app.messages.clear()
+        second = await app.chat("Hi")
+
+        assert second is first
+        assert [m.role for m in app.messages] == ["user", "assistant"]
+        assert len(app.llm.history) == 1
+
+    @pytest.mark.asyncio
+    async def test_different_conversation_misses_cache(self):
+        app = make_app(responses=["Hello!", "Bye!"], cache=True)
+
+        await app.chat("Hi")
+        app.messages.clear()
+        response = await app.chat("Bye")
+
+        assert response.content == "Bye!"
+        assert len(app.llm.history) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_state(self):
+        app = make_app(
+            responses=["Free plan", "Pro plan"], cache=True, state=State(plan="free")
+        )
+
+        await app.chat("Which plan am I on?")
+        app.messages.clear()
+        app.state.plan = "pro"
+        response = await app.chat("Which plan am I on?")
+
+        assert response.content == "Pro plan"
+        assert len(app.llm.history) == 2
+
+    @pytest.mark.asyncio
+    async def test_registration_clears_cache(self):
+        app = make_app(responses=["Hello!", "From skill"], cache=True)
+
+        await app.chat("Hi")
+        assert app._chat_cache
+
+        @app.skill
+        async def greet(ctx: Context, eng: Engine):
+            ctx.append(await eng.reply(ctx))
+
+        assert not app._chat_cache
+
+        app.messages.clear()
+        response = await app.chat("Hi")
+        assert response.content == "From skill"
+
+    @pytest.mark.asyncio
+    async def test_paused_turns_are_not_cached(self):
+        app = make_app(responses=["Done"], cache=True)
+
+        @app.skill
+        async def ask(ctx: Context, eng: Engine):
+            await eng.input()
+            ctx.append(await eng.reply(ctx))
+
+        await app.chat("Start")
+        assert not app._chat_cache
+
+        await app.chat("More")
+        assert not app._chat_cache
+
+
 # ---------------------------------------------------------------------------
 # _build_filters tests
 # ---------------------------------------------------------------------------
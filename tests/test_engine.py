@@ -187,6 +187,20 @@ async def test_reply_passes_expanded_messages():
     assert sent[-1].content == "extra instruction"
 
 
+@pytest.mark.asyncio
+async def test_reply_with_history_recording_off():
+    llm = MockLLM(responses=["first", "second"], record_history=False)
+    engine = Engine(llm)
+    ctx = Context([Message.user("q")])
+
+    await engine.reply(ctx)
+    llm.responses.append("third")
+    await engine.reply(ctx)
+
+    assert llm.history == []
+    assert list(llm.responses) == ["third"]
+
+
 # ---------------------------------------------------------------------------
 # Engine.input / wait / put  (queue synchronisation)
 # ---------------------------------------------------------------------------
@@ -375,6 +389,36 @@ async def test_choose_maps_result_back_to_original_object():
     assert result is opts[1]
 
 
+# ---------------------------------------------------------------------------
+# Engine._create_cot_model
+# ---------------------------------------------------------------------------
+
+
+def test_cot_model_is_reused_across_calls_and_engines():
+    a = Engine(MockLLM())._create_cot_model("Decide", bool)
+    b = Engine(MockLLM())._create_cot_model("Decide", bool)
+
+    assert a is b
+    assert set(a.model_fields) == {"reasoning", "result"}
+
+
+def test_cot_model_differs_per_result_type():
+    engine = Engine(MockLLM())
+
+    assert engine._create_cot_model("Decide", bool) is not engine._create_cot_model(
+        "Decide", str
+    )
+
+
+def test_cot_model_schema_is_cached():
+    from lingo.engine import _json_schema
+
+    model = Engine(MockLLM())._create_cot_model("Decide", bool)
+
+    assert _json_schema(model) is _json_schema(model)
+    assert _json_schema(model) == model.model_json_schema()
+
+
 # ---------------------------------------------------------------------------
 # Engine.decide
 # ---------------------------------------------------------------------------
@@ -642,14 +686,15 @@ def _counting_llm() -> tuple[LLM, list[int]]:
     caller's try/except can handle it; only the count matters for these tests.
     """
     counts: list[int] = []
-    llm = MagicMock(spec=LLM)
 
-    async def fake_create(model, messages, **kwargs):
-        counts.append(len(messages))
-        raise StopIteration("count captured")  # bail out; caller catches
+    # A bare stub: Engine only ever calls create() on these paths, and
+    # MagicMock(spec=LLM) would introspect the whole LLM class per call.
+    class CountingLLM:
+        async def create(self, model, messages, **kwargs):
+            counts.append(len(messages))
+            raise StopIteration("count captured")  # bail out; caller catches
 
-    llm.create = fake_create
-    return llm, counts
+    return CountingLLM(), counts
 
 
 @pytest.mark.asyncio
@@ -1,4 +1,5 @@
 # tests/test_flows.py
+import asyncio
 import pytest
 from lingo import Flow, Engine, Context, Message
 from lingo.mock import MockLLM
@@ -82,6 +83,32 @@ async def test_parallel_fork_isolation():
     assert ctx.messages[-1].role == "assistant"
 
 
+@pytest.mark.asyncio
+async def test_parallel_merges_branches_in_order():
+    """Verify that parallel runs branches concurrently and merges in order."""
+    engine = Engine(MockLLM())
+    released = asyncio.Event()
+
+    async def wait_for_b(context: Context, engine: Engine):
+        # Would deadlock if the branches ran one after the other
+        await released.wait()
+        context.append(Message.assistant("A"))
+        return "A"
+
+    async def release(context: Context, engine: Engine):
+        released.set()
+        context.append(Message.assistant("B"))
+        return "B"
+
+    flow = Flow[list]().parallel(Flow().custom(wait_for_b), Flow().custom(release))
+
+    ctx = Context([Message.user("Input")])
+    results = await asyncio.wait_for(flow.execute(ctx, engine), timeout=1)
+
+    assert results == ["A", "B"]
+    assert [m.content for m in ctx.messages] == ["Input", "A", "B"]
+
+
 @pytest.mark.asyncio
 async def test_compression_pruning():
     """Verify that compress modifies context length in-place."""
@@ -101,3 +128,48 @@ async def test_compression_pruning():
     # Original length was 2. Now should be [Instruction 1, Summary]
     assert len(ctx.messages) == 2
     assert "SUMMARY" in str(ctx.messages[1].content)
+
+
+@pytest.mark.asyncio
+async def test_single_and_empty_sequences():
+    """One-node flows return their node's result; empty flows return None."""
+    engine = Engine(MockLLM(["Only"]))
+
+    assert await Flow[str]().reply().execute(Context([]), engine) == "Only"
+    assert await Flow().execute(Context([]), engine) is None
+
+
+@pytest.mark.asyncio
+async def test_route_reuses_its_routing_instruction():
+    """Route builds its option descriptions once and executes the choice."""
+
+    class PickLastEngine(Engine):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.instructions = []
+
+        async def choose(self, context, options, *instructions):
+            self.instructions.append(instructions)
+            return options[-1]
+
+    engine = PickLastEngine(MockLLM(["From B", "From B again"]))
+    flow = Flow[str]().route(
+        Flow("a", "Handles A.").reply(), Flow("b").reply(), prompt="Prefer b."
+    )
+
+    assert await flow.execute(Context([Message.user("Hi")]), engine) == "From B"
+    assert await flow.execute(Context([Message.user("Hi")]), engine) == "From B again"
+
+    first, second = engine.instructions
+    assert first[0] is second[0]
+    assert "a: Handles A." in first[0]
+    assert "b: No description provided." in first[0]
+    assert first[0].endswith("Prefer b.")
+
+
+def test_builtin_nodes_are_slotted():
+    """Built-in nodes carry no per-instance __dict__."""
+    flow = Flow[str]("slots").append("System Init").reply("Greet")
+
+    assert not hasattr(flow, "__dict__")
+    assert all(not hasattr(node, "__dict__") for node in flow.nodes)
@@ -0,0 +1,122 @@
+# tests/test_load_env.py
+"""
+Tests for lingo.utils.load_env — the minimal .env loader used by the examples.
+"""
+
+import os
+import runpy
+
+import pytest
+
+from lingo.utils import load_env
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    # Isolate os.environ so loaded keys don't leak into other tests
+    monkeypatch.setattr(os, "environ", {})
+
+    path = tmp_path / ".env"
+    path.write_text(
+        "# a comment\n"
+        "\n"
+        "LE_PLAIN=plain\n"
+        'LE_QUOTED = "quoted # value"\n'
+        'LE_QUOTED_COMMENT="value" # trailing\n'
+        "LE_SINGLE='it # is' # trailing\n"
+        'LE_UNCLOSED="open\n'
+        "export LE_EXPORTED='exported'\n"
+        "LE_COMMENTED=value # trailing\n"
+        "LE_SET=from-file\n"
+        "not a pair\n"
+    )
+    return path
+
+
+def test_parses_pairs(env_file):
+    assert load_env(env_file) is True
+
+    assert os.environ["LE_PLAIN"] == "plain"
+    assert os.environ["LE_QUOTED"] == "quoted # value"
+    assert os.environ["LE_EXPORTED"] == "exported"
+    assert os.environ["LE_COMMENTED"] == "value"
+    assert os.environ["LE_QUOTED_COMMENT"] == "value"
+    assert os.environ["LE_SINGLE"] == "it # is"
+    assert os.environ["LE_UNCLOSED"] == '"open'
+
+
+def test_does_not_override_existing(env_file, monkeypatch):
+    monkeypatch.setenv("LE_SET", "from-env")
+    load_env(env_file)
+
+    assert os.environ["LE_SET"] == "from-env"
+
+
+def test_loads_once_until_file_changes(env_file):
+    assert load_env(env_file) is True
+    assert load_env(env_file) is False
+
+    env_file.write_text("LE_PLAIN=changed-and-longer\nLE_SET=edited\n")
+    assert load_env(env_file) is True
+
+    # Values this file set are updated; others are still left alone
+    assert os.environ["LE_PLAIN"] == "changed-and-longer"
+    assert os.environ["LE_SET"] == "edited"
+
+
+def test_reload_keeps_values_set_elsewhere(env_file):
+    load_env(env_file)
+    os.environ["LE_PLAIN"] = "from-user"
+
+    env_file.write_text("LE_PLAIN=changed-and-longer\n")
+    load_env(env_file)
+
+    assert os.environ["LE_PLAIN"] == "from-user"
+
+
+def test_finds_env_in_parent_of_calling_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "environ", {})
+    (tmp_path / ".env").write_text("LE_FOUND=yes\n")
+    script = tmp_path / "examples" / "script.py"
+    script.parent.mkdir()
+    script.write_text("from lingo.utils import load_env\nloaded = load_env()\n")
+
+    # Run from elsewhere: the search starts at the script, not the cwd
+    monkeypatch.chdir(tmp_path.parent)
+    result = runpy.run_path(str(script))
+
+    assert result["loaded"] is True
+    assert os.environ["LE_FOUND"] == "yes"
+
+
+def test_stacklevel_searches_from_wrapper_caller(tmp_path, monkeypatch):
+    monkeypatch.setattr(os, "environ", {})
+    (tmp_path / ".env").write_text("LE_FOUND=yes\n")
+    script = tmp_path / "app" / "script.py"
+    script.parent.mkdir()
+    script.write_text("loaded = wrapped_load_env()\n")
+
+    # The wrapper lives in this file, away from the .env under test
+    monkeypatch.chdir(tmp_path.parent)
+    result = runpy.run_path(
+        str(script), init_globals={"wrapped_load_env": wrapped_load_env}
+    )
+
+    assert result["loaded"] is True
+    assert os.environ["LE_FOUND"] == "yes"
+
+
+def wrapped_load_env():
+    """A helper around load_env, as a project might write one."""
+    return load_env(stacklevel=2)
+
+
+def test_missing_file(tmp_path):
+    assert load_env(tmp_path / "missing.env") is False
+
+
+def test_skip_flag(env_file, monkeypatch):
+    monkeypatch.setenv("LINGO_SKIP_DOTENV", "1")
+
+    assert load_env(env_file) is False
+    assert "LE_PLAIN" not in os.environ
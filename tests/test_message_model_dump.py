@@ -96,3 +96,58 @@ def test_tool_call_round_trips_through_dump():
     assert dumps[2]["role"] == "tool"
     assert dumps[2]["tool_call_id"] == "c1"
     assert dumps[3]["role"] == "assistant"
+
+
+def test_to_api_dict_is_memoized_and_matches_model_dump():
+    msg = Message.user("hello")
+    first = msg.to_api_dict()
+    assert first == msg.model_dump()
+    assert msg.to_api_dict() is first
+
+
+def test_to_api_dict_refreshes_after_field_assignment():
+    msg = Message.assistant("draft")
+    assert msg.to_api_dict()["content"] == "draft"
+
+    msg.content = "final"
+    assert msg.to_api_dict()["content"] == "final"
+
+    copy = msg.model_copy(update={"content": "copied"})
+    assert copy.to_api_dict()["content"] == "copied"
+
+
+def test_to_api_dict_does_not_affect_equality():
+    a, b = Message.user("same"), Message.user("same")
+    a.to_api_dict()
+    assert a == b
+
+
+def test_to_api_dict_sees_in_place_tool_call_edits():
+    msg = Message.assistant(
+        "", tool_calls=[ToolCall(id="c1", name="a", arguments={"x": 1})]
+    )
+    assert len(msg.to_api_dict()["tool_calls"]) == 1
+
+    msg.tool_calls.append(ToolCall(id="c2", name="b"))
+    msg.tool_calls[0].arguments["x"] = 2
+
+    calls = msg.to_api_dict()["tool_calls"]
+    assert [c["id"] for c in calls] == ["c1", "c2"]
+    assert calls[0]["function"]["arguments"] == '{"x": 2}'
+
+
+def test_to_api_dict_cache_is_not_pickled_or_copied():
+    import copy
+    import pickle
+
+    msg = Message.user("hello")
+    msg.to_api_dict()
+
+    for other in (
+        pickle.loads(pickle.dumps(msg)),
+        copy.copy(msg),
+        copy.deepcopy(msg),
+        msg.model_copy(),
+    ):
+        assert "_api_dict" not in other.__dict__
+        assert other == msg
@@ -1,3 +1,5 @@
+import pytest
+from pydantic import ValidationError
 from lingo.llm import Message, ToolCall
 
 
@@ -27,3 +29,23 @@ def test_assistant_message_with_tool_calls():
     assert msg.tool_calls == [tc]
     assert msg.thinking == "some reasoning"
     assert msg.stop_reason == "tool_calls"
+
+
+def test_factories_match_validated_construction():
+    tc = ToolCall(id="c1", name="read", arguments={"path": "x"})
+
+    assert Message.system("s") == Message(role="system", content="s")
+    assert Message.user("u") == Message(role="user", content="u")
+    assert Message.assistant("a", tool_calls=[tc], stop_reason="tool_calls") == (
+        Message(
+            role="assistant", content="a", tool_calls=[tc], stop_reason="tool_calls"
+        )
+    )
+
+
+def test_factories_still_validate_unexpected_input():
+    with pytest.raises(ValidationError):
+        Message.assistant("a", stop_reason="not-a-reason")
+
+    with pytest.raises(ValidationError):
+        Message.system(42)
@@ -0,0 +1,50 @@
+# tests/test_package.py
+"""
+Tests for the public `lingo` package surface (lazy exports).
+"""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import lingo
+
+
+def test_all_exports_resolve():
+    for name in lingo.__all__:
+        assert getattr(lingo, name) is not None
+
+
+def test_lazy_exports_are_the_real_objects():
+    from lingo.core import Lingo
+    from lingo.state import State
+
+    assert lingo.Lingo is Lingo
+    assert lingo.State is State
+
+
+def test_flow_export_is_the_decorator_not_the_module():
+    importlib.import_module("lingo.flow")
+    from lingo import flow
+
+    assert callable(flow)
+    assert flow.__module__ == "lingo.flow"
+
+
+def test_dir_lists_lazy_exports():
+    assert {"Lingo", "Embedder", "State", "depends"} <= set(dir(lingo))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        lingo.DoesNotExist
+
+
+def test_import_does_not_load_core():
+    code = "import sys, lingo; print('lingo.core' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
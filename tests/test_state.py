@@ -27,6 +27,16 @@ def test_init_and_access():
         _ = s.c
 
 
+def test_init_leaves_caller_data_untouched():
+    """Merging kwargs into the state never writes to the caller's dict."""
+    data = {"a": 1}
+    s = State(data, b=2)
+    s.c = 3
+
+    assert data == {"a": 1}
+    assert s == {"a": 1, "b": 2, "c": 3}
+
+
 def test_schema_validation():
     """Test Pydantic schema validation."""
 
@@ -63,6 +73,169 @@ def test_deep_copy_isolation():
     assert clone.nested["x"] == 999
 
 
+def test_clone_copies_nested_containers_and_objects():
+    """clone() deep copies nested builtins and falls back to deepcopy otherwise."""
+
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    original = State(
+        {
+            "rows": [{"tags": {"a"}, "pair": (1, [2])}],
+            "point": Point(1),
+        }
+    )
+    clone = original.clone()
+
+    clone.rows[0]["tags"].add("b")
+    clone.rows[0]["pair"][1].append(3)
+    clone.point.x = 2
+
+    assert original.rows == [{"tags": {"a"}, "pair": (1, [2])}]
+    assert original.point.x == 1
+
+
+def test_clone_handles_self_referencing_values():
+    """Cyclic values clone to cyclic copies."""
+    loop = []
+    loop.append(loop)
+
+    clone = State({"loop": loop}).clone()
+
+    assert clone.loop is not loop
+    assert clone.loop[0] is clone.loop
+
+
+def test_clone_large_schema_state():
+    """Large validated states clone via pickle, falling back when it fails."""
+
+    class Wide(BaseModel):
+        grid: list[list[int]]
+
+    data = {f"k{i}": i for i in range(10)}
+    original = State({"grid": [[1], [2]], **data}, schema=Wide)
+    clone = original.clone()
+    clone.grid[0].append(9)
+
+    assert original.grid == [[1], [2]]
+    assert clone.k9 == 9
+
+    class Local:  # Local classes can't be pickled
+        pass
+
+    original.obj = Local()
+    clone = original.clone()
+    clone.grid[1].append(9)
+
+    assert original.grid == [[1], [2]]
+    assert clone.obj is not original.obj
+
+
+def test_clone_keeps_aliasing_at_any_size():
+    """Values shared between keys stay shared in snapshots, small or large."""
+
+    class Wide(BaseModel):
+        a: list[int]
+        b: list[int]
+
+    small = State({"a": [1], "b": None})
+    small.b = small.a
+    extra = {f"k{i}": i for i in range(10)}
+    large = State({"a": [1], "b": [1], **extra}, schema=Wide)
+    large.b = large.a
+
+    for original in (small, large):
+        before = original.a
+
+        # fork() restores from a snapshot without re-validating
+        with original.fork():
+            pass
+
+        assert original.a is original.b
+        assert original.a is not before
+
+
+def test_clone_handles_deep_nesting():
+    """Nesting deeper than the recursion limit still clones."""
+    import sys
+
+    deep = leaf = []
+    for _ in range(sys.getrecursionlimit() * 2):
+        child = {"next": [], "pair": (1, {2})}
+        leaf.append(child)
+        leaf = child["next"]
+    leaf.append(deep)
+
+    clone = State({"deep": deep, "t": (deep, {1})}).clone()
+
+    assert clone.deep is not deep
+    assert clone.t[0] is clone.deep
+    assert clone.t[1] == {1}
+
+    node = clone.deep
+    for _ in range(sys.getrecursionlimit() * 2):
+        assert node[0]["pair"] == (1, {2})
+        node = node[0]["next"]
+    assert node[0] is clone.deep
+
+
+def test_clone_surfaces_errors_from_user_reduce():
+    """Bugs in user pickling hooks aren't swallowed by the pickle snapshot."""
+
+    class Broken:
+        def __reduce__(self):
+            raise ValueError("bug in __reduce__")
+
+        def __deepcopy__(self, memo):
+            raise ValueError("bug in __deepcopy__")
+
+    class Wide(BaseModel):
+        grid: list[list[int]]
+
+    s = State({"grid": [[1]], **{f"k{i}": i for i in range(10)}}, schema=Wide)
+    s.obj = Broken()
+
+    with pytest.raises(ValueError, match="__reduce__"):
+        s.clone()
+
+
+def test_deepcopy_copies_each_state_once():
+    """copy.deepcopy() keeps shared references to a State shared."""
+    import copy
+
+    inner = State({"log": [1]}, shared_keys={"db"}, db=object())
+    inner.me = inner
+
+    outer = copy.deepcopy({"a": inner, "b": inner})
+
+    assert outer["a"] is outer["b"]
+    assert outer["a"] is not inner
+    assert outer["a"].me is outer["a"]
+    assert outer["a"].db is inner.db
+    assert outer["a"]._shared_keys is inner._shared_keys
+
+    outer["a"].log.append(2)
+    assert inner.log == [1]
+
+
+def test_state_is_slotted_and_picklable():
+    """Plain States keep internals in slots and survive a pickle round-trip."""
+    import pickle
+
+    s = State({"count": 1}, shared_keys={"db"}, trust_internal=True)
+
+    assert not hasattr(s, "__dict__")
+    with pytest.raises(AttributeError):
+        s._scratch = 1
+
+    restored = pickle.loads(pickle.dumps(s))
+
+    assert restored == s
+    assert restored._shared_keys == {"db"}
+    assert restored._trust_internal
+
+
 def test_shared_keys():
     """Test that shared_keys are passed by reference."""
     # A mutable shared resource (e.g., a list or object)
@@ -80,6 +253,10 @@ def test_shared_keys():
     assert s1.db == ["initial", "modified"]
     assert s1.db is s2.db  # Same object identity
 
+    # 3. Clones share the same frozen key set
+    assert s1._shared_keys == frozenset({"db"})
+    assert s2._shared_keys is s1._shared_keys
+
 
 def test_atomic_transaction_success():
     """Test atomic() commits changes on success."""
@@ -104,6 +281,53 @@ def test_atomic_transaction_rollback():
     assert s.count == 0
 
 
+def test_atomic_validates_schema_on_commit():
+    """atomic() re-validates on exit unless the state trusts internal writes."""
+
+    class Memory(BaseModel):
+        count: int
+
+    s = State({"count": 0}, schema=Memory)
+
+    with pytest.raises(ValueError, match="State validation failed"):
+        with s.atomic():
+            s.count = "not-a-number"
+
+    assert s.count == 0
+
+    trusted = State({"count": 0}, schema=Memory, trust_internal=True)
+
+    with trusted.atomic():
+        trusted.count = "1"
+
+    assert trusted.count == "1"
+    assert trusted.clone()._trust_internal
+
+
+def test_validate_writes_back_coerced_values():
+    """validate() applies defaults and nested coercions, keeps extra keys."""
+
+    class Memory(BaseModel):
+        scores: list[int]
+        weights: dict[str, float] = {}
+        note: str | None = None
+
+    s = State(
+        {"scores": [1.0, 2.0], "weights": {"a": 1}, "extra": "kept"}, schema=Memory
+    )
+
+    assert s.scores == [1, 2]
+    assert all(type(x) is int for x in s.scores)
+    assert type(s.weights["a"]) is float
+    assert "note" in s and s.note is None
+    assert s.extra == "kept"
+
+    s.scores = ["3"]
+    s.validate()
+
+    assert s.scores == [3]
+
+
 def test_fork_scope():
     """Test fork() context manager (always rollback)."""
     s = State({"mode": "prod"})
@@ -139,6 +363,48 @@ def test_subclassing_ide_support():
     assert isinstance(clone, AgentState)
     assert clone.score == 20
 
+    # Declared fields are known to the class up front
+    assert AgentState._public_names == {"score", "user"}
+
+
+def test_subclass_mutable_defaults_are_not_shared():
+    """Each instance gets its own copy of list/dict class defaults."""
+
+    class Inventory(State):
+        items: list = []
+        gold: int = 0
+
+    first, second = Inventory(), Inventory()
+    first["items"].append("sword")
+
+    assert second["items"] == []
+    assert Inventory(items=["shield"])["items"] == ["shield"]
+    assert Inventory._mutable_defaults == ("items",)
+
+
+def test_subclass_resource_defaults_are_shared():
+    """Defaults that are resources or shared keys are never copied."""
+    import threading
+
+    class Conn:
+        def __init__(self):
+            self.lock = threading.Lock()
+
+    conn = Conn()
+
+    class Session(State):
+        db = conn
+        pool: list = [conn]
+        cache: dict = {}
+
+    s = Session(shared_keys={"db", "cache"})
+
+    assert s.db is conn
+    assert s["cache"] is Session._class_defaults["cache"]
+    # A plain list that can't be copied is shared rather than failing
+    assert s["pool"] is Session._class_defaults["pool"]
+    assert Session()["cache"] is not Session._class_defaults["cache"]
+
 
 def test_render_full_state():
     """Test rendering the entire state without keys."""
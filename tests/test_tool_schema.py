@@ -1,3 +1,4 @@
+import inspect
 from typing import Literal, Optional
 
 from lingo.llm import _python_type_to_json_schema as j
@@ -68,3 +69,28 @@ def test_prebuilt_schema_passthrough():
         assert s["parameters"]["properties"]["pattern"]["description"] == "rich"
     finally:
         grep.json_schema = None  # reset
+
+
+# --- Signature introspection is done once per tool ---
+
+
+def test_signature_introspected_once(monkeypatch):
+    @lingo_tool
+    async def ping(host: str, count: int = 1) -> str:
+        """Ping a host."""
+        return ""
+
+    calls = []
+    real_signature = inspect.signature
+
+    def counting_signature(obj, *args, **kwargs):
+        calls.append(obj)
+        return real_signature(obj, *args, **kwargs)
+
+    monkeypatch.setattr(inspect, "signature", counting_signature)
+
+    for _ in range(3):
+        assert ping.parameters() == {"host": str, "count": int}
+        assert ping.defaults() == {"count": 1}
+
+    assert len(calls) == 1